@@ -8,22 +8,170 @@ Key insight: We don't try to PROVE claims. We try to DISPROVE them.
 If we fail to disprove, the claim is likely true.
 """
 
-import json
+import asyncio
+import functools
+import io
+import os
 import re
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
+from pydantic import ValidationError
+from rapidfuzz import fuzz, process
+
 from api.models import (
     ContributionClaim,
+    DisprovalAnalysis,
     Evidence,
     EvidenceCollection,
     EvidenceStrength,
     EvidenceType,
+    GitCommit,
     GitLog,
     MeetingTranscript,
     VerdictType,
     VerificationVerdict,
 )
-from analysis.gemini_client import GeminiClient, get_gemini_client, is_gemini_configured
+from analysis.gemini_client import GeminiClient, RateLimited, get_gemini_client, is_gemini_configured
+
+
+# Claim words that say nothing about *what* was built
+_TRIAGE_STOPWORDS = frozenset({
+    "built", "created", "designed", "developed", "entire", "implemented",
+    "made", "most", "that", "this", "whole", "with", "worked", "wrote",
+})
+
+
+# Sort key putting the strongest evidence first
+_STRENGTH_RANK = {
+    EvidenceStrength.STRONG: 0,
+    EvidenceStrength.MODERATE: 1,
+    EvidenceStrength.WEAK: 2,
+}
+
+
+# Words of commit messages and filenames for the keyword index
+_WORD = re.compile(r"\w+")
+
+# Separators between the parts of a name or an email local part
+_NAME_SEPARATORS = re.compile(r"[\s+\-_.,]+")
+
+
+def _name_parts(name_lower: str) -> list[str]:
+    """Non-empty parts of a lowercased name"""
+    return [part for part in _NAME_SEPARATORS.split(name_lower) if part]
+
+
+@dataclass(slots=True)
+class NameFeatures:
+    """Parts of a contributor's name used to recognise abbreviated claimant names"""
+    lowered: str
+    first: str
+    last: str
+    email_base: str = ""
+    parts: tuple[str, ...] = ()
+    
+    @classmethod
+    def from_name(cls, name: str, email: str = "") -> "NameFeatures":
+        lowered = name.lower()
+        parts = _name_parts(lowered) or [lowered]
+        return cls(
+            lowered=lowered,
+            first=parts[0],
+            last=parts[-1],
+            email_base=email.partition("@")[0].lower(),
+            parts=tuple(parts)
+        )
+    
+    def names_exactly(self, claimant_lower: str, parts: list[str]) -> bool:
+        """True for the full name, whole words of it ("bob", "martinez") or the email local part."""
+        if claimant_lower in (self.lowered, self.email_base):
+            return True
+        return bool(parts) and all(part in self.parts for part in parts)
+    
+    def matches(self, claimant_lower: str, parts: list[str]) -> bool:
+        """
+        True for "bob m.", "b martinez" or the email local part, given "Bob Martinez".
+        
+        Abbreviations are initials only, so "Dan Smith" is not taken for "Dana Smith".
+        """
+        if self.email_base and claimant_lower == self.email_base:
+            return True
+        if len(parts) < 2:
+            return False
+        first, last = parts[0], parts[-1]
+        return (
+            (first == self.first and (last == self.last or last == self.last[0]))
+            or (last == self.last and first == self.first[0])
+        )
+
+
+def _utc_naive(timestamp: datetime) -> datetime:
+    """Comparable form of a timestamp: aware ones converted to naive UTC (logs can mix both)."""
+    if timestamp.tzinfo is None:
+        return timestamp
+    return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@functools.lru_cache(maxsize=256)
+def _attribution_pattern(claimant_lower: str) -> re.Pattern:
+    """
+    Match lowercased context lines attributed to a claimant.
+    
+    Transcript lines ("[l12] speaker: ...") set the `statement` group and `colon`
+    only when the speaker is exactly the claimant; git lines ("[abc1234] author
+    (date): ...") match on an author name prefix and leave `statement` unset.
+    """
+    return re.compile(
+        rf"^\[(?:(?P<statement>l\d+)|[^\]\s]+)\] {re.escape(claimant_lower)}(?P<colon>:)?",
+        re.MULTILINE
+    )
+
+
+def _extract_json(response: str, open_ch: str = "[", close_ch: str = "]") -> Optional[str]:
+    """
+    Extract the first balanced JSON array/object from a Gemini response.
+    
+    Single linear scan tracking bracket depth; brackets inside string
+    literals are ignored. Returns None if no balanced value is found.
+    """
+    # Fast path: Gemini usually wraps JSON in a ```json fence
+    fence = response.find("```json")
+    if fence != -1:
+        body_start = fence + len("```json")
+        body_end = response.find("```", body_start)
+        response = response[body_start:body_end if body_end != -1 else None]
+    
+    start = response.find(open_ch)
+    if start == -1:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(response)):
+        ch = response[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == open_ch:
+            depth += 1
+        elif ch == close_ch:
+            depth -= 1
+            if depth == 0:
+                return response[start:i + 1]
+    
+    return None
 
 
 class ClaimVerificationEngine:
@@ -40,14 +188,100 @@ class ClaimVerificationEngine:
     - Is there evidence someone ELSE actually built it?
     """
     
+    # Evidence sets with at least this many commits + statements get a
+    # claimant-focused context instead of the full dump
+    focus_min_items = 200
+    # Evidence contexts kept per evidence set, least recently used evicted first
+    # (focused ones are keyed by claimant spelling, which comes from user input)
+    context_cache_size = 32
+    # Claimant commits matching the claim's keywords needed to skip Gemini
+    triage_min_commits = 6
+    # Evidence items per side included in the deep-mode synthesis prompt
+    synthesis_max_evidence = 10
+    # Minimum similarity (0-100) for a misspelt claimant's closest contributor
+    # to be added to the focused context (never credited to the claimant)
+    name_match_cutoff = 85
+    
     def __init__(self, gemini_client: Optional[GeminiClient] = None):
         """Initialize the verification engine."""
         self.gemini = gemini_client
         self._evidence: Optional[EvidenceCollection] = None
+        self._context_cache: OrderedDict[Optional[tuple[str, frozenset[str]]], str] = OrderedDict()
+        self._evidence_size = 0
+        # Lowercased views of the evidence, rebuilt by set_evidence
+        self._commit_ids_by_author: dict[str, range] = {}
+        self._commit_word_index: dict[str, set[int]] = {}
+        self._commit_vocabulary: list[str] = []
+        self._contributor_features: dict[str, NameFeatures] = {}
+        # All commits oldest first, with their comparable timestamps for bisect
+        self._commits_by_time: list[GitCommit] = []
+        self._commit_times: list[datetime] = []
+        self._context_lower: dict[str, str] = {}
+        self.evidence_signature: Optional[str] = None
     
-    def set_evidence(self, evidence: EvidenceCollection):
-        """Set the evidence collection to analyze against."""
+    def set_evidence(self, evidence: EvidenceCollection, signature: Optional[str] = None):
+        """
+        Set the evidence collection to analyze against.
+        
+        `signature` identifies the evidence content; re-setting evidence with
+        the current signature keeps everything already derived from it.
+        """
+        if signature is not None and signature == self.evidence_signature and self._evidence:
+            return
         self._evidence = evidence
+        self.evidence_signature = signature
+        self._context_cache = OrderedDict()
+        self._evidence_size = sum(len(c) for c in evidence.commits_by_author.values()) + sum(
+            len(s) for s in evidence.statements_by_speaker.values()
+        )
+        # Small evidence sets send the same full context with every claim, so build it now
+        if self._evidence_size < self.focus_min_items:
+            self._context_cache[None] = self._build_evidence_context()
+        
+        # Inverted index from the lowercased words of each commit's message and
+        # filenames to commit ids; each author's commits get a contiguous id range
+        self._commit_ids_by_author = {}
+        self._commit_word_index = {}
+        next_id = 0
+        for author, commits in evidence.commits_by_author.items():
+            self._commit_ids_by_author[author] = range(next_id, next_id + len(commits))
+            for commit_id, commit in enumerate(commits, next_id):
+                text = "\n".join([commit.message, *(f.filename for f in commit.files_changed)]).lower()
+                for word in set(_WORD.findall(text)):
+                    self._commit_word_index.setdefault(word, set()).add(commit_id)
+            next_id += len(commits)
+        self._commit_vocabulary = sorted(self._commit_word_index)
+        self._context_lower = {}
+        
+        # Split contributor names (and commit emails) once for claimant resolution
+        self._contributor_features = {}
+        for name in evidence.all_contributors:
+            commits = evidence.commits_by_author.get(name, ())
+            email = next((c.author_email for c in commits if c.author_email), "")
+            self._contributor_features[name] = NameFeatures.from_name(name, email)
+        
+        commits = evidence.git_log.commits if evidence.git_log else []
+        self._commits_by_time = sorted(commits, key=lambda c: _utc_naive(c.timestamp))
+        self._commit_times = [_utc_naive(c.timestamp) for c in self._commits_by_time]
+    
+    def commits_in_range(
+        self,
+        start: datetime,
+        end: datetime,
+        author: Optional[str] = None
+    ) -> list[GitCommit]:
+        """
+        Commits made between `start` and `end` (inclusive), oldest first.
+        
+        Found by binary search over the time index built in set_evidence;
+        `author` restricts the result to one author's commits.
+        """
+        lo = bisect_left(self._commit_times, _utc_naive(start))
+        hi = bisect_right(self._commit_times, _utc_naive(end))
+        commits = self._commits_by_time[lo:hi]
+        if author is not None:
+            commits = [c for c in commits if c.author_name == author]
+        return commits
     
     async def verify_claim(
         self,
@@ -69,52 +303,47 @@ class ClaimVerificationEngine:
                 claimant, claim, "No evidence has been uploaded for analysis."
             )
         
-        # Prepare evidence context for Gemini
-        evidence_context = self._prepare_evidence_context()
+        # Prepare evidence context for Gemini. Small evidence sets are sent whole;
+        # large ones are focused on the claimant to keep the prompt small.
+        if self._evidence_size >= self.focus_min_items:
+            evidence_context = self._prepare_evidence_context(focus_author=claimant, claim=claim)
+        else:
+            evidence_context = self._prepare_evidence_context()
         
         # If Gemini is not configured, use heuristic analysis
         if not is_gemini_configured() or not self.gemini:
-            return self._heuristic_verification(claimant, claim, evidence_context)
+            result = self._heuristic_verification(claimant, claim, evidence_context)
+            result.cacheable = True
+            return result
+        
+        # Easy claims (one unambiguous contributor with plenty of matching
+        # commits) don't need Gemini: the heuristic reaches the same verdict for
+        # free. Absent, misspelt, partial or ambiguous claimants always go to
+        # Gemini, as does any claim the heuristic itself doesn't verify.
+        triage_score = self._quick_triage(claimant, claim)
+        if triage_score > 0.9:
+            result = self._heuristic_verification(claimant, claim, evidence_context)
+            if result.verdict == VerdictType.VERIFIED:
+                result.explanation = result.explanation.replace(
+                    "(Heuristic mode - configure GEMINI_API_KEY for AI-powered analysis",
+                    "(Heuristic mode - evidence was decisive, Gemini analysis skipped"
+                )
+                result.cacheable = True
+                return result
         
         # === THE DISPROVAL LOOP ===
         # Wrapped in try-catch to gracefully handle API errors (rate limits, etc.)
         try:
-            # Step 1: Ask Gemini what evidence MUST exist if claim is true
-            expected_evidence = await self._get_expected_evidence(claim, claimant)
-            
-            # If we got an empty response, Gemini might be failing - try heuristic
-            if not expected_evidence:
-                print("Gemini returned empty response, falling back to heuristic mode")
-                return self._heuristic_verification(claimant, claim, evidence_context)
-            
-            # Step 2: Search for supporting evidence
-            supporting = await self._find_supporting_evidence(
-                claimant, claim, evidence_context, expected_evidence
-            )
-            
-            # Step 3: Search for COUNTER-evidence (the key insight!)
-            counter = await self._find_counter_evidence(
-                claimant, claim, evidence_context
-            )
-            
-            # Step 4: Identify missing expected evidence
-            missing = await self._find_missing_evidence(
-                claimant, claim, evidence_context, expected_evidence
-            )
-            
-            # Step 5: Synthesize verdict
-            verdict = await self._synthesize_verdict(
-                claimant, claim, supporting, counter, missing, evidence_context
-            )
-            
-            return verdict
-            
+            if os.environ.get("DEEP_MODE") == "1":
+                return await self._verify_deep(claimant, claim, evidence_context)
+            return await self._verify_one_shot(claimant, claim, evidence_context)
+        
         except Exception as e:
             error_msg = str(e)
             print(f"Gemini API error, falling back to heuristic: {error_msg}")
             
             # Check if it's a rate limit error
-            if "429" in error_msg or "quota" in error_msg.lower() or "rate" in error_msg.lower():
+            if isinstance(e, RateLimited):
                 # Fall back to heuristic with a note about rate limiting
                 result = self._heuristic_verification(claimant, claim, evidence_context)
                 result.explanation = result.explanation.replace(
@@ -127,26 +356,241 @@ class ClaimVerificationEngine:
                 result = self._heuristic_verification(claimant, claim, evidence_context)
                 return result
     
-    def _prepare_evidence_context(self) -> str:
-        """Prepare all evidence as context string for Gemini."""
-        parts = []
+    async def verify_claims(
+        self,
+        pairs: list[tuple[str, str]],
+        concurrency: int = 16
+    ) -> list[VerificationVerdict]:
+        """
+        Verify a batch of claims concurrently.
+        
+        Args:
+            pairs: (claimant, claim) tuples to verify
+            concurrency: Maximum number of verifications in flight at once
+        
+        Returns:
+            One VerificationVerdict per pair, in the same order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _verify_one(pair: tuple[str, str]) -> VerificationVerdict:
+            async with semaphore:
+                return await self.verify_claim(*pair)
+        
+        return await asyncio.gather(*(_verify_one(pair) for pair in pairs))
+    
+    async def _verify_one_shot(
+        self,
+        claimant: str,
+        claim: str,
+        evidence_context: str
+    ) -> VerificationVerdict:
+        """
+        Run the whole disproval loop in a single structured-output Gemini call.
+        
+        Expected, supporting, counter and missing evidence plus the verdict come
+        back as one DisprovalAnalysis, so the evidence context is sent once.
+        """
+        prompt = f"""You are verifying a contribution claim by trying to DISPROVE it.
+
+CLAIM: "{claimant}" says: "{claim}"
+
+Work through these steps using ONLY the evidence below:
+1. EXPECTED EVIDENCE: If the claim is TRUE, what specific git commits, file changes
+   and meeting discussions MUST exist?
+2. SUPPORTING EVIDENCE: Items that support the claim.
+3. COUNTER-EVIDENCE: Items that DISPROVE or CONTRADICT the claim, such as:
+   - Someone ELSE did the work (different author in git)
+   - Timeline mismatches (work done before/after claimant's involvement)
+   - Contradicting statements in transcripts
+   - Evidence showing minimal or no involvement by claimant
+4. MISSING EVIDENCE: Significant expected evidence that is absent.
+5. VERDICT: One of "verified", "disputed", or "unverifiable"
+   - verified: Strong supporting evidence, minimal counter-evidence
+   - disputed: Significant counter-evidence that contradicts the claim
+   - unverifiable: Not enough evidence to confirm or deny
+   with a confidence between 0.0 and 1.0 and a 2-3 sentence explanation
+   citing specific evidence.
+
+For each evidence item give the source type (git_commit or meeting_transcript),
+the source ID (commit hash or line number), its strength and what it shows.
+
+EVIDENCE:
+{evidence_context}"""
+        
+        try:
+            analysis = await self.gemini.structured_json(prompt, DisprovalAnalysis)
+        except ValidationError as e:
+            # E.g. JSON cut off at the output token cap
+            print(f"Gemini returned an invalid structured analysis, falling back to heuristic: {e}")
+            result = self._heuristic_verification(claimant, claim, evidence_context)
+            result.explanation = result.explanation.replace(
+                "(Heuristic mode - configure GEMINI_API_KEY for AI-powered analysis",
+                "(Heuristic fallback - Gemini returned an invalid analysis, retry for AI analysis"
+            )
+            return result
+        
+        return VerificationVerdict(
+            claim=claim,
+            claimant=claimant,
+            verdict=analysis.verdict,
+            confidence=min(max(analysis.confidence, 0.0), 1.0),
+            explanation=analysis.explanation,
+            supporting_evidence=[Evidence.model_construct(**dict(e)) for e in analysis.supporting_evidence],
+            counter_evidence=[Evidence.model_construct(**dict(e)) for e in analysis.counter_evidence],
+            missing_evidence=analysis.missing_evidence,
+            cacheable=True
+        )
+    
+    async def _verify_deep(
+        self,
+        claimant: str,
+        claim: str,
+        evidence_context: str
+    ) -> VerificationVerdict:
+        """
+        Run the disproval loop as separate Gemini calls (DEEP_MODE=1).
+        
+        Slower and more expensive than the one-shot path, but each step gets
+        Gemini's full attention - worth it for high-stakes claims.
+        """
+        # Step 1: Ask Gemini what evidence MUST exist if claim is true
+        expected_evidence = await self._get_expected_evidence(claim, claimant)
+        
+        # If we got an empty response, Gemini might be failing - try heuristic
+        if not expected_evidence:
+            print("Gemini returned empty response, falling back to heuristic mode")
+            return self._heuristic_verification(claimant, claim, evidence_context)
+        
+        # Steps 2-4 only depend on the expected evidence, so run them concurrently:
+        # supporting evidence, COUNTER-evidence (the key insight!) and missing evidence
+        supporting, counter, missing = await asyncio.gather(
+            self._find_supporting_evidence(
+                claimant, claim, evidence_context, expected_evidence
+            ),
+            self._find_counter_evidence(
+                claimant, claim, evidence_context
+            ),
+            self._find_missing_evidence(
+                claimant, claim, evidence_context, expected_evidence
+            ),
+            return_exceptions=True
+        )
+        supporting, counter, missing = (
+            [] if isinstance(result, Exception) else result
+            for result in (supporting, counter, missing)
+        )
+        
+        # Step 5: Synthesize verdict
+        verdict = await self._synthesize_verdict(
+            claimant, claim, supporting, counter, missing, evidence_context
+        )
+        
+        return verdict
+    
+    def _prepare_evidence_context(
+        self,
+        focus_author: Optional[str] = None,
+        claim: str = ""
+    ) -> str:
+        """
+        Prepare evidence as context string for Gemini.
+        
+        Without a focus author every commit and statement is included. With one,
+        only the activity of matching contributors (and anyone named in the claim)
+        is included in full, along with statements mentioning them; everyone else
+        is reduced to per-person counts.
+        
+        The evidence is fixed between set_evidence calls, so each context is built
+        once and reused for every claim verified against it, up to
+        context_cache_size contexts.
+        """
+        focus = None
+        if focus_author:
+            focus = (focus_author.lower(), self._focus_names(focus_author, claim))
+        
+        context = self._context_cache.get(focus)
+        if context is not None:
+            self._context_cache.move_to_end(focus)
+            return context
+        
+        context = self._context_cache[focus] = self._build_evidence_context(focus)
+        if len(self._context_cache) > self.context_cache_size:
+            _, evicted = self._context_cache.popitem(last=False)
+            self._context_lower.pop(evicted, None)
+        return context
+    
+    def _focus_names(self, claimant: str, claim: str) -> frozenset[str]:
+        """
+        Contributors a claim is about: the claimant (by name prefix) and anyone
+        named in it. A claimant matching no contributor brings in the closest
+        name instead, so Gemini can see whether it is a misspelling.
+        """
+        claim_lower = claim.lower()
+        keys, names = self._evidence.contributor_index
+        claimant_names = self._evidence.contributors_with_prefix(self._resolve_claimant(claimant))
+        if not claimant_names:
+            closest = self._closest_contributor(claimant)
+            claimant_names = [closest] if closest else []
+        return frozenset(claimant_names).union(
+            name for key, name in zip(keys, names) if key in claim_lower
+        )
+    
+    def _build_evidence_context(self, focus: Optional[tuple[str, frozenset[str]]] = None) -> str:
+        """Render the evidence collection as one line per commit/statement."""
+        buffer = io.StringIO()
+        write = buffer.write
         
-        if self._evidence.git_log and self._evidence.git_log.commits:
-            parts.append("=== GIT COMMIT LOG ===")
-            for commit in self._evidence.git_log.commits:
+        if focus is None:
+            commits = self._evidence.git_log.commits if self._evidence.git_log else []
+        else:
+            claimant_lower, names = focus
+            mention_terms = [claimant_lower, *(name.lower() for name in names)]
+            commits_by_author = self._evidence.commits_by_author
+            commits = sorted(
+                (c for name in names for c in commits_by_author.get(name, [])),
+                key=lambda c: _utc_naive(c.timestamp)
+            )
+        
+        if commits:
+            write("=== GIT COMMIT LOG ===\n")
+            for commit in commits:
                 files_str = ", ".join(f.filename for f in commit.files_changed) if commit.files_changed else "N/A"
-                parts.append(
-                    f"[{commit.short_hash}] {commit.author_name} ({commit.timestamp.strftime('%Y-%m-%d')}): "
-                    f"{commit.message}\n  Files: {files_str}"
+                write(
+                    f"[{commit.short_hash}] {commit.author_name} ({commit.timestamp:%Y-%m-%d}): "
+                    f"{commit.message}\n  Files: {files_str}\n"
                 )
         
         if self._evidence.transcripts:
             for i, transcript in enumerate(self._evidence.transcripts):
-                parts.append(f"\n=== MEETING TRANSCRIPT {i+1}: {transcript.title} ===")
+                write(f"\n=== MEETING TRANSCRIPT {i+1}: {transcript.title} ===\n")
                 for stmt in transcript.statements:
-                    parts.append(f"[L{stmt.line_number}] {stmt.speaker}: {stmt.content}")
+                    if focus is not None and stmt.speaker not in names:
+                        if not any(term in stmt.content_lower for term in mention_terms):
+                            continue
+                    write(f"[L{stmt.line_number}] {stmt.speaker}: {stmt.content}\n")
+        
+        if focus is not None:
+            other_authors = {
+                name: len(c) for name, c in self._evidence.commits_by_author.items() if name not in names
+            }
+            other_speakers = {
+                name: len(s) for name, s in self._evidence.statements_by_speaker.items() if name not in names
+            }
+            if other_authors or other_speakers:
+                write("\n=== OTHER CONTRIBUTORS (summarized) ===\n")
+            if other_authors:
+                write(
+                    f"{sum(other_authors.values())} commits by {len(other_authors)} other authors: "
+                    + ", ".join(f"{name} ({count})" for name, count in other_authors.items()) + "\n"
+                )
+            if other_speakers:
+                write(
+                    f"{sum(other_speakers.values())} statements by {len(other_speakers)} other speakers: "
+                    + ", ".join(f"{name} ({count})" for name, count in other_speakers.items()) + "\n"
+                )
         
-        return "\n".join(parts)
+        return buffer.getvalue()
     
     async def _get_expected_evidence(self, claim: str, claimant: str) -> str:
         """Ask Gemini what evidence should exist if the claim is true."""
@@ -189,13 +633,11 @@ For each supporting item, specify:
 EVIDENCE:
 {evidence_context}
 
-OUTPUT FORMAT (JSON array):
-[
-  {{"type": "git_commit", "source": "abc123", "summary": "what it shows", "strength": "strong"}},
-  ...
-]
+OUTPUT FORMAT (one item per line, fields separated by "|"):
+type|source|strength|summary
+git_commit|abc123|strong|what it shows
 
-Return ONLY the JSON array, no other text. If no supporting evidence found, return []."""
+Return ONLY these lines, no header and no other text. If no supporting evidence found, return NONE."""
 
         try:
             response = await self.gemini.analyze(prompt)
@@ -234,13 +676,11 @@ For each counter-evidence item, specify:
 EVIDENCE:
 {evidence_context}
 
-OUTPUT FORMAT (JSON array):
-[
-  {{"type": "git_commit", "source": "def456", "summary": "Shows Bob authored auth module, not Alice", "strength": "strong"}},
-  ...
-]
+OUTPUT FORMAT (one item per line, fields separated by "|"):
+type|source|strength|summary
+git_commit|def456|strong|Shows Bob authored auth module, not Alice
 
-Return ONLY the JSON array. If no counter-evidence found, return []."""
+Return ONLY these lines, no header and no other text. If no counter-evidence found, return NONE."""
 
         try:
             response = await self.gemini.analyze(prompt)
@@ -293,16 +733,10 @@ Return ONLY the JSON array. If all expected evidence is present, return []."""
     ) -> VerificationVerdict:
         """Synthesize the final verdict from all evidence."""
         
-        # Prepare summary for Gemini
-        supporting_summary = "\n".join(
-            f"- {e.summary} (source: {e.source}, strength: {e.strength.value})"
-            for e in supporting
-        ) or "None found"
-        
-        counter_summary = "\n".join(
-            f"- {e.summary} (source: {e.source}, strength: {e.strength.value})"
-            for e in counter
-        ) or "None found"
+        # Prepare summary for Gemini: strongest evidence first, capped so the
+        # prompt stays bounded however much evidence the searches found
+        supporting_summary = self._summarize_evidence(supporting)
+        counter_summary = self._summarize_evidence(counter)
         
         missing_summary = "\n".join(f"- {m}" for m in missing) or "None"
         
@@ -310,10 +744,10 @@ Return ONLY the JSON array. If all expected evidence is present, return []."""
 
 CLAIM: "{claimant}" says: "{claim}"
 
-SUPPORTING EVIDENCE:
+SUPPORTING EVIDENCE (strongest first):
 {supporting_summary}
 
-COUNTER-EVIDENCE:
+COUNTER-EVIDENCE (strongest first):
 {counter_summary}
 
 MISSING EVIDENCE:
@@ -344,7 +778,8 @@ Return ONLY the JSON object."""
                 explanation=result.get("explanation", "Unable to generate explanation."),
                 supporting_evidence=supporting,
                 counter_evidence=counter,
-                missing_evidence=missing
+                missing_evidence=missing,
+                cacheable=True
             )
         except Exception as e:
             print(f"Error synthesizing verdict: {e}")
@@ -352,38 +787,53 @@ Return ONLY the JSON object."""
                 claimant, claim, f"Error during analysis: {str(e)}"
             )
     
+    def _summarize_evidence(self, evidence: list[Evidence]) -> str:
+        """Render evidence as prompt bullets, strongest first, at most synthesis_max_evidence."""
+        if not evidence:
+            return "None found"
+        ranked = sorted(evidence, key=lambda e: _STRENGTH_RANK[e.strength])[:self.synthesis_max_evidence]
+        buffer = io.StringIO()
+        for e in ranked:
+            buffer.write(f"- {e.summary} (source: {e.source})\n")
+        return buffer.getvalue().rstrip("\n")
+    
     def _parse_evidence_list(self, response: str, claim_type: str) -> list[Evidence]:
-        """Parse Gemini's response into Evidence objects."""
-        try:
-            # Extract JSON from response
-            json_match = re.search(r'\[[\s\S]*\]', response)
-            if not json_match:
-                return []
-            
-            data = json.loads(json_match.group())
-            evidence_list = []
+        """
+        Parse Gemini's response into Evidence objects.
+        
+        Expects one `type|source|strength|summary` item per line. Summary comes
+        last so any "|" inside it survives the split; malformed lines are skipped.
+        """
+        evidence_list = []
+        
+        for line in response.splitlines():
+            parts = line.strip().lstrip("-* ").split("|", 3)
+            if len(parts) != 4:
+                continue
             
-            for item in data:
-                evidence_list.append(Evidence(
-                    type=EvidenceType(item.get("type", "git_commit")),
-                    source=str(item.get("source", "")),
-                    summary=item.get("summary", ""),
-                    strength=EvidenceStrength(item.get("strength", "moderate").lower())
+            item_type, source, strength, summary = (part.strip() for part in parts)
+            try:
+                # Fields are already coerced to the right types, so skip validation
+                evidence_list.append(Evidence.model_construct(
+                    type=EvidenceType(item_type.lower()),
+                    source=source,
+                    summary=summary,
+                    strength=EvidenceStrength(strength.lower() or "moderate")
                 ))
-            
-            return evidence_list
-        except Exception as e:
-            print(f"Error parsing evidence list: {e}")
-            return []
+            except ValueError as e:
+                # Header row or an unknown type/strength label
+                print(f"Skipping unparseable evidence line: {e}")
+        
+        return evidence_list
     
     def _parse_string_list(self, response: str) -> list[str]:
         """Parse Gemini's response into a list of strings."""
         try:
-            json_match = re.search(r'\[[\s\S]*\]', response)
-            if not json_match:
+            json_text = _extract_json(response, "[", "]")
+            if not json_text:
                 return []
             
-            data = json.loads(json_match.group())
+            data = orjson.loads(json_text)
             return [str(item) for item in data if item]
         except Exception as e:
             print(f"Error parsing string list: {e}")
@@ -392,11 +842,11 @@ Return ONLY the JSON object."""
     def _parse_verdict_response(self, response: str) -> dict:
         """Parse Gemini's verdict response."""
         try:
-            json_match = re.search(r'\{[\s\S]*\}', response)
-            if not json_match:
+            json_text = _extract_json(response, "{", "}")
+            if not json_text:
                 return {}
             
-            return json.loads(json_match.group())
+            return orjson.loads(json_text)
         except Exception as e:
             print(f"Error parsing verdict response: {e}")
             return {}
@@ -419,6 +869,79 @@ Return ONLY the JSON object."""
             missing_evidence=["Insufficient evidence for analysis"]
         )
     
+    def _resolve_claimant(self, claimant: str) -> str:
+        """
+        Lowercased name to look the claimant up by.
+        
+        The one contributor the claimant names exactly (see _exact_contributors);
+        then the claimant itself when it prefixes a contributor's name; then the
+        one contributor whose abbreviated name it is ("Bob M."); otherwise the
+        claimant itself. Misspellings are not resolved: a near-miss name belongs
+        to someone else as often as not.
+        """
+        exact = self._exact_contributors(claimant)
+        if len(exact) == 1:
+            return exact[0].lower()
+        
+        claimant_lower = claimant.lower()
+        if self._evidence.contributors_with_prefix(claimant_lower):
+            return claimant_lower
+        
+        parts = _name_parts(claimant_lower)
+        matches = [f.lowered for f in self._contributor_features.values() if f.matches(claimant_lower, parts)]
+        if len(matches) == 1:
+            return matches[0]
+        return claimant_lower
+    
+    def _exact_contributors(self, claimant: str) -> list[str]:
+        """
+        Contributors the claimant names by full name, whole words of it or email
+        local part: "Bob" names "Bob Martinez" but not "Bobby Tables".
+        """
+        claimant_lower = claimant.lower()
+        parts = _name_parts(claimant_lower)
+        return [
+            name for name, features in self._contributor_features.items()
+            if features.names_exactly(claimant_lower, parts)
+        ]
+    
+    def _closest_contributor(self, claimant: str) -> Optional[str]:
+        """Contributor name most similar to the claimant (e.g. "Bob Martines"), if one reaches name_match_cutoff."""
+        keys, names = self._evidence.contributor_index
+        best = process.extractOne(claimant.lower(), keys, scorer=fuzz.ratio, score_cutoff=self.name_match_cutoff)
+        return names[best[2]] if best else None
+    
+    def _quick_triage(self, claimant: str, claim: str) -> float:
+        """
+        Cheap confidence score for a claim, used to decide whether Gemini is needed.
+        
+        0.0 unless the claimant names exactly one contributor (a prefix such as
+        "Al" or a name shared by several people is never decisive); otherwise
+        rises from 0.4 to 1.0 with the number of that contributor's commits whose
+        message or changed files have a word starting with a keyword from the
+        claim ("auth" matches "authentication"). Keyword matches come from the
+        commit word index, so the cost does not grow with the number of commits.
+        """
+        names = self._exact_contributors(claimant)
+        if len(names) != 1:
+            return 0.0
+        claimant_lower = names[0].lower()
+        claimant_commits = set(self._commit_ids_by_author.get(names[0], ()))
+        
+        tokens = {
+            word for word in re.findall(r"[a-z0-9_]{4,}", claim.lower())
+            if word not in _TRIAGE_STOPWORDS and word not in claimant_lower
+        }
+        vocabulary = self._commit_vocabulary
+        matched: set[int] = set()
+        for token in tokens:
+            for i in range(bisect_left(vocabulary, token), len(vocabulary)):
+                if not vocabulary[i].startswith(token):
+                    break
+                matched.update(self._commit_word_index[vocabulary[i]])
+        matching = len(matched & claimant_commits)
+        return 0.4 + 0.6 * min(matching / self.triage_min_commits, 1.0)
+    
     def _heuristic_verification(
         self,
         claimant: str,
@@ -430,19 +953,26 @@ Return ONLY the JSON object."""
         
         Uses simple pattern matching to find evidence.
         """
-        evidence_lower = evidence_context.lower()
-        claimant_lower = claimant.lower()
+        evidence_lower = self._context_lower.get(evidence_context)
+        if evidence_lower is None:
+            evidence_lower = self._context_lower[evidence_context] = evidence_context.lower()
+        claimant_lower = self._resolve_claimant(claimant) if self._evidence else claimant.lower()
         
         # Count mentions of claimant in evidence
         claimant_mentions = evidence_lower.count(claimant_lower)
         
-        # Check if claimant appears in git commits
-        git_pattern = re.compile(rf'\[[\w]+\]\s*{re.escape(claimant_lower)}', re.IGNORECASE)
-        git_matches = git_pattern.findall(evidence_context)
-        
-        # Check transcript for claimant speaking
-        transcript_pattern = re.compile(rf'\[\w+\]\s*{re.escape(claimant_lower)}:', re.IGNORECASE)
-        transcript_matches = transcript_pattern.findall(evidence_context)
+        # One scan with a per-claimant cached pattern: "[L12] speaker: ..." lines
+        # are statements, "[hash] Author (date): ..." lines are commits. An
+        # attributed line is also a mention, so an absent claimant (the DISPUTED
+        # case) skips building and running the pattern.
+        git_matches = 0
+        transcript_matches = 0
+        if claimant_mentions:
+            for match in _attribution_pattern(claimant_lower).finditer(evidence_lower):
+                if match["statement"] is None:
+                    git_matches += 1
+                elif match["colon"]:
+                    transcript_matches += 1
         
         supporting = []
         counter = []
@@ -452,8 +982,8 @@ Return ONLY the JSON object."""
             supporting.append(Evidence(
                 type=EvidenceType.GIT_COMMIT,
                 source="heuristic",
-                summary=f"Found {len(git_matches)} commits by {claimant}",
-                strength=EvidenceStrength.MODERATE if len(git_matches) > 2 else EvidenceStrength.WEAK
+                summary=f"Found {git_matches} commits by {claimant}",
+                strength=EvidenceStrength.MODERATE if git_matches > 2 else EvidenceStrength.WEAK
             ))
         else:
             missing.append(f"No git commits found from {claimant}")
@@ -462,7 +992,7 @@ Return ONLY the JSON object."""
             supporting.append(Evidence(
                 type=EvidenceType.MEETING_TRANSCRIPT,
                 source="heuristic",
-                summary=f"Found {len(transcript_matches)} statements by {claimant}",
+                summary=f"Found {transcript_matches} statements by {claimant}",
                 strength=EvidenceStrength.MODERATE
             ))
         
@@ -470,7 +1000,7 @@ Return ONLY the JSON object."""
         if claimant_mentions > 5 and git_matches:
             verdict = VerdictType.VERIFIED
             confidence = min(0.7 + (claimant_mentions * 0.02), 0.95)
-            explanation = f"Heuristic analysis found {claimant_mentions} mentions of {claimant} in the evidence, including {len(git_matches)} git commits. This suggests active involvement."
+            explanation = f"Heuristic analysis found {claimant_mentions} mentions of {claimant} in the evidence, including {git_matches} git commits. This suggests active involvement."
         elif claimant_mentions > 0:
             verdict = VerdictType.UNVERIFIABLE
             confidence = 0.4
@@ -5,10 +5,101 @@ Contribution Truth
 Handles all communication with Google's Gemini API.
 """
 
+import asyncio
+import hashlib
 import os
-from typing import Optional
+import time
+from typing import AsyncIterator, Optional
 
 import google.generativeai as genai
+import httpx
+import orjson
+from pydantic import BaseModel, ValidationError
+
+
+# Response cache policies (set via the CACHE_POLICY environment variable):
+# - enabled:  serve repeated prompts from the cache, call Gemini on a miss
+# - replay:   only serve from the cache, raise CacheMiss instead of calling Gemini
+# - write_only: always call Gemini and cache the response (cache warming)
+# - disabled: always call Gemini, never cache
+# Set GEMINI_CACHE_DIR to persist the cache on disk across restarts.
+CACHE_POLICIES = ("enabled", "replay", "write_only", "disabled")
+
+
+class CacheMiss(LookupError):
+    """Raised in replay mode when a prompt has no cached response."""
+
+
+class RateLimited(RuntimeError):
+    """Raised when Gemini rejects a request with HTTP 429 (quota exhausted)."""
+
+
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
+
+
+def _to_gemini_schema(schema: dict, defs: Optional[dict] = None) -> dict:
+    """
+    Convert a pydantic JSON schema into Gemini's responseSchema format.
+    
+    Gemini accepts an OpenAPI subset: no $ref/$defs and upper-case type names.
+    """
+    if defs is None:
+        defs = schema.get("$defs", {})
+    if "$ref" in schema:
+        return _to_gemini_schema(defs[schema["$ref"].rsplit("/", 1)[-1]], defs)
+    
+    converted = {}
+    if "type" in schema:
+        converted["type"] = schema["type"].upper()
+    if "enum" in schema:
+        converted["enum"] = [str(value) for value in schema["enum"]]
+    if "items" in schema:
+        converted["items"] = _to_gemini_schema(schema["items"], defs)
+    if "properties" in schema:
+        converted["properties"] = {
+            name: _to_gemini_schema(prop, defs) for name, prop in schema["properties"].items()
+        }
+    if "required" in schema:
+        converted["required"] = list(schema["required"])
+    return converted
+
+
+class _TokenBucket:
+    """
+    Proactive rate limiter for requests-per-minute and tokens-per-minute quotas.
+    
+    Both buckets refill continuously; acquire() waits out whichever deficit is
+    larger instead of letting the request fail with a 429.
+    """
+    
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.request_tokens = float(rpm)
+        self.token_tokens = float(tpm)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self.request_tokens = min(self.rpm, self.request_tokens + elapsed * self.rpm / 60)
+        self.token_tokens = min(self.tpm, self.token_tokens + elapsed * self.tpm / 60)
+    
+    async def acquire(self, estimated_tokens: int = 0):
+        """Wait until one request and `estimated_tokens` tokens are available."""
+        estimated_tokens = min(estimated_tokens, self.tpm)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.request_tokens >= 1 and self.token_tokens >= estimated_tokens:
+                    self.request_tokens -= 1
+                    self.token_tokens -= estimated_tokens
+                    return
+                request_wait = (1 - self.request_tokens) * 60 / self.rpm
+                token_wait = (estimated_tokens - self.token_tokens) * 60 / self.tpm
+                await asyncio.sleep(max(request_wait, token_wait))
 
 
 class GeminiClient:
@@ -18,6 +109,14 @@ class GeminiClient:
     Handles long-context reasoning and structured output parsing.
     """
     
+    # Gemini free tier quota; requests beyond it are delayed rather than rejected
+    rpm = 20
+    tpm = 1_000_000
+    # Output cap for structured_json: the fused disproval analysis (evidence
+    # lists plus verdict) is far longer than the line-list responses, and a
+    # truncated JSON response fails validation
+    structured_max_output_tokens = 8192
+    
     def __init__(self, api_key: Optional[str] = None):
         """Initialize the Gemini client."""
         self.api_key = api_key or os.environ.get("GEMINI_API_KEY")
@@ -27,18 +126,101 @@ class GeminiClient:
                 "GEMINI_API_KEY not found. Set it as an environment variable or pass it to the constructor."
             )
         
+        self.cache_policy = os.environ.get("CACHE_POLICY", "enabled").lower()
+        if self.cache_policy not in CACHE_POLICIES:
+            raise ValueError(
+                f"Unknown CACHE_POLICY '{self.cache_policy}'. Expected one of: {', '.join(CACHE_POLICIES)}"
+            )
+        cache_dir = os.environ.get("GEMINI_CACHE_DIR")
+        if cache_dir:
+            import diskcache
+            self._cache = diskcache.Cache(cache_dir)
+        else:
+            self._cache: dict[str, str] = {}
+        self._bucket = _TokenBucket(rpm=self.rpm, tpm=self.tpm)
+        # Shared HTTP client for the async path, created on first use so the
+        # keep-alive pool belongs to the running event loop
+        self._http: Optional[httpx.AsyncClient] = None
+        
         genai.configure(api_key=self.api_key)
         
         # Use Gemini 2.0 Flash for fast, capable analysis
+        self.generation_config = {
+            "temperature": 0.3,  # Lower for more deterministic analysis
+            "top_p": 0.95,
+            "max_output_tokens": 2048,  # Text responses are short line lists / verdict objects
+        }
         self.model = genai.GenerativeModel(
             model_name="gemini-2.0-flash",
-            generation_config={
-                "temperature": 0.3,  # Lower for more deterministic analysis
-                "top_p": 0.95,
-                "max_output_tokens": 8192,
-            }
+            generation_config=self.generation_config
         )
     
+    def _http_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=GEMINI_API_BASE,
+                headers={"x-goog-api-key": self.api_key},
+                limits=httpx.Limits(max_connections=100, keepalive_expiry=60),
+                timeout=httpx.Timeout(60.0, connect=10.0),
+            )
+        return self._http
+    
+    async def aclose(self):
+        """Close pooled connections and the disk cache; call on application shutdown."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        if not isinstance(self._cache, dict):
+            self._cache.close()
+    
+    def _request_body(self, full_prompt: str, generation_config: dict) -> dict:
+        """Build a generateContent request body (REST field names are camelCase)."""
+        config = {}
+        for name, value in generation_config.items():
+            if name == "response_schema":
+                value = _to_gemini_schema(value.model_json_schema())
+            head, *rest = name.split("_")
+            config[head + "".join(part.title() for part in rest)] = value
+        return {
+            "contents": [{"role": "user", "parts": [{"text": full_prompt}]}],
+            "generationConfig": config,
+        }
+    
+    def _cache_key(
+        self,
+        full_prompt: str,
+        response_format: str = "text",
+        generation_config: Optional[dict] = None
+    ) -> str:
+        """Key a prompt by everything that influences Gemini's response."""
+        config = generation_config or self.generation_config
+        raw = (
+            f"{full_prompt}|{self.model.model_name}|{config['temperature']}"
+            f"|{config['top_p']}|{config['max_output_tokens']}|{response_format}"
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
+    
+    def _cached_response(self, key: str) -> Optional[str]:
+        """Look up a cached response, enforcing the replay policy on a miss."""
+        if self.cache_policy in ("disabled", "write_only"):
+            return None
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        if self.cache_policy == "replay":
+            raise CacheMiss(f"No cached Gemini response for prompt {key[:12]} (CACHE_POLICY=replay)")
+        return None
+    
+    def _store_response(self, key: str, text: str):
+        """Cache a response unless caching is disabled."""
+        if self.cache_policy != "disabled":
+            self._cache[key] = text
+    
+    def _evict_response(self, key: str):
+        """Drop a cached response, e.g. one that turned out to be unusable."""
+        self._cache.pop(key, None)
+    
     async def analyze(self, prompt: str, context: str = "") -> str:
         """
         Send a prompt to Gemini for analysis.
@@ -54,12 +236,122 @@ class GeminiClient:
         if context:
             full_prompt = f"{context}\n\n---\n\n{prompt}"
         
+        return await self._generate(full_prompt)
+    
+    async def warm(self, prompts: list[str]):
+        """
+        Fill the response cache for a batch of prompts.
+        
+        Requests run concurrently; the rate limiter spaces them out to stay
+        within quota.
+        """
+        await asyncio.gather(*(self.analyze(prompt) for prompt in prompts))
+    
+    async def analyze_stream(self, prompt: str, context: str = "") -> AsyncIterator[str]:
+        """
+        Send a prompt to Gemini and yield the response text as it is generated.
+        
+        A cached response is yielded as a single chunk.
+        
+        Args:
+            prompt: The analysis prompt
+            context: Additional context (evidence data)
+        """
+        full_prompt = prompt
+        if context:
+            full_prompt = f"{context}\n\n---\n\n{prompt}"
+        
+        async for chunk in self._generate_stream(full_prompt):
+            yield chunk
+    
+    async def structured_json(self, prompt: str, schema: type[BaseModel]) -> BaseModel:
+        """
+        Send a prompt whose response must conform to a JSON schema.
+        
+        Uses Gemini's native structured output (response_mime_type=application/json),
+        so the response is guaranteed JSON and needs no extraction.
+        
+        Args:
+            prompt: The analysis prompt
+            schema: Pydantic model describing the expected response
+        
+        Returns:
+            The response parsed into an instance of `schema`
+        
+        Raises:
+            ValidationError: The response does not match `schema` (e.g. it was
+                cut off); it is evicted from the cache so a retry calls Gemini
+        """
+        generation_config = {
+            **self.generation_config,
+            "max_output_tokens": self.structured_max_output_tokens,
+            "response_mime_type": "application/json",
+            "response_schema": schema,
+        }
+        response_format = f"json:{schema.__name__}"
+        text = await self._generate(prompt, generation_config, response_format)
         try:
-            response = await self.model.generate_content_async(full_prompt)
-            return response.text
+            return schema.model_validate_json(text)
+        except ValidationError:
+            self._evict_response(self._cache_key(prompt, response_format, generation_config))
+            raise
+    
+    async def _generate(
+        self,
+        full_prompt: str,
+        generation_config: Optional[dict] = None,
+        response_format: str = "text"
+    ) -> str:
+        """Call Gemini and return the complete response text."""
+        return "".join([
+            chunk async for chunk in self._generate_stream(full_prompt, generation_config, response_format)
+        ])
+    
+    async def _generate_stream(
+        self,
+        full_prompt: str,
+        generation_config: Optional[dict] = None,
+        response_format: str = "text"
+    ) -> AsyncIterator[str]:
+        """Stream a Gemini response through the response cache and rate limiter."""
+        key = self._cache_key(full_prompt, response_format, generation_config)
+        cached = self._cached_response(key)
+        if cached is not None:
+            yield cached
+            return
+        
+        # Rough estimate of ~4 characters per token
+        await self._bucket.acquire(estimated_tokens=len(full_prompt) // 4)
+        
+        # Direct REST call over the pooled client: after the first request the
+        # connection (and its DNS lookup and TLS handshake) is reused
+        chunks = []
+        try:
+            async with self._http_client().stream(
+                "POST",
+                f"/{self.model.model_name}:streamGenerateContent",
+                params={"alt": "sse"},
+                content=orjson.dumps(self._request_body(full_prompt, generation_config or self.generation_config)),
+                headers={"Content-Type": "application/json"},
+            ) as response:
+                if response.status_code == 429:
+                    raise RateLimited("Gemini API quota exhausted (HTTP 429)")
+                response.raise_for_status()
+                # Server-sent events: one "data: {...}" line per partial response
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    candidate = orjson.loads(line[5:])["candidates"][0]
+                    text = "".join(part.get("text", "") for part in candidate.get("content", {}).get("parts", []))
+                    if text:
+                        chunks.append(text)
+                        yield text
         except Exception as e:
             print(f"Gemini API error: {e}")
             raise
+        
+        # Only complete responses are cached
+        self._store_response(key, "".join(chunks))
     
     def analyze_sync(self, prompt: str, context: str = "") -> str:
         """
@@ -69,8 +361,14 @@ class GeminiClient:
         if context:
             full_prompt = f"{context}\n\n---\n\n{prompt}"
         
+        key = self._cache_key(full_prompt)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+        
         try:
             response = self.model.generate_content(full_prompt)
+            self._store_response(key, response.text)
             return response.text
         except Exception as e:
             print(f"Gemini API error: {e}")
@@ -118,6 +416,12 @@ def get_gemini_client() -> GeminiClient:
     return _client
 
 
+async def close_gemini_client():
+    """Release the singleton's pooled connections, if it was ever created."""
+    if _client is not None:
+        await _client.aclose()
+
+
 def is_gemini_configured() -> bool:
     """Check if Gemini API is configured."""
     return bool(os.environ.get("GEMINI_API_KEY"))
@@ -0,0 +1,50 @@
+"""
+ASGI Middleware - Request Guards
+Contribution Truth
+"""
+
+from fastapi import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ContentSizeLimitMiddleware:
+    """
+    Reject request bodies larger than `max_content_size` bytes with a 413.
+    
+    A declared Content-Length over the limit is rejected before the app runs.
+    Otherwise body bytes are counted as they are received, so chunked uploads
+    without a length are cut off as soon as they cross the limit instead of
+    being spooled in full.
+    """
+    
+    def __init__(self, app: ASGIApp, max_content_size: int):
+        self.app = app
+        self.max_content_size = max_content_size
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        detail = f"Request body exceeds the {self.max_content_size} byte limit"
+        
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_content_size:
+            response = JSONResponse({"detail": detail}, status_code=413)
+            await response(scope, receive, send)
+            return
+        
+        received = 0
+        
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_content_size:
+                    # Raised inside the endpoint's body read, so FastAPI turns it into the response
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+        
+        await self.app(scope, limited_receive, send)
@@ -3,10 +3,24 @@ Data Models - Unified Internal Representations
 Contribution Truth
 """
 
+import re
+from bisect import bisect_left
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    computed_field,
+    field_serializer,
+)
+from pydantic.dataclasses import dataclass
+
+
+_WORD = re.compile(r"\w+")
 
 
 class EvidenceType(str, Enum):
@@ -35,7 +49,11 @@ class VerdictType(str, Enum):
 # Git Data Models
 # =============================================================================
 
-class GitFileChange(BaseModel):
+# Commits, file changes and statements are the most numerous objects, so they
+# are slotted pydantic dataclasses rather than models (no per-instance __dict__)
+
+@dataclass(frozen=True, slots=True, config=ConfigDict(extra="ignore"))
+class GitFileChange:
     """A single file change in a commit"""
     filename: str
     additions: int = 0
@@ -43,7 +61,8 @@ class GitFileChange(BaseModel):
     status: str = "modified"  # added, modified, deleted, renamed
 
 
-class GitCommit(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class GitCommit:
     """A single git commit"""
     hash: str
     short_hash: str = ""
@@ -51,9 +70,9 @@ class GitCommit(BaseModel):
     author_email: str = ""
     timestamp: datetime
     message: str
-    files_changed: list[GitFileChange] = []
+    files_changed: list[GitFileChange] = Field(default_factory=list)
     
-    def model_post_init(self, __context):
+    def __post_init__(self):
         if not self.short_hash:
             self.short_hash = self.hash[:7]
 
@@ -61,23 +80,31 @@ class GitCommit(BaseModel):
 class GitLog(BaseModel):
     """Parsed git log containing all commits"""
     commits: list[GitCommit] = []
-    contributors: list[str] = []
     
-    def model_post_init(self, __context):
-        if not self.contributors and self.commits:
-            self.contributors = list(set(c.author_name for c in self.commits))
+    @computed_field
+    @cached_property
+    def contributors(self) -> list[str]:
+        """Unique commit authors in order of first appearance (computed on first access)"""
+        return list(dict.fromkeys(c.author_name for c in self.commits))
 
 
 # =============================================================================
 # Meeting Transcript Models
 # =============================================================================
 
-class TranscriptStatement(BaseModel):
+@dataclass(frozen=True, slots=True, config=ConfigDict(extra="ignore"))
+class TranscriptStatement:
     """A single statement in a meeting transcript"""
     speaker: str
     content: str
     timestamp: Optional[str] = None
     line_number: int = 0
+    # Lowercased content for case-insensitive searches, filled in at parse time
+    content_lower: str = Field(default="", exclude=True, repr=False)
+    
+    def __post_init__(self):
+        if not self.content_lower:
+            object.__setattr__(self, "content_lower", self.content.lower())
 
 
 class MeetingTranscript(BaseModel):
@@ -85,11 +112,29 @@ class MeetingTranscript(BaseModel):
     title: str = "Meeting"
     date: Optional[datetime] = None
     statements: list[TranscriptStatement] = []
-    participants: list[str] = []
     
-    def model_post_init(self, __context):
-        if not self.participants and self.statements:
-            self.participants = list(set(s.speaker for s in self.statements))
+    @computed_field
+    @cached_property
+    def participants(self) -> list[str]:
+        """Unique speakers in order of first appearance (computed on first access)"""
+        return list(dict.fromkeys(s.speaker for s in self.statements))
+    
+    @cached_property
+    def statements_by_speaker(self) -> dict[str, list[TranscriptStatement]]:
+        """Statements grouped by speaker in order of first appearance (computed on first access)"""
+        by_speaker: dict[str, list[TranscriptStatement]] = {}
+        for statement in self.statements:
+            by_speaker.setdefault(statement.speaker, []).append(statement)
+        return by_speaker
+    
+    @cached_property
+    def word_index(self) -> dict[str, list[int]]:
+        """Positions of the statements containing each lowercased word (computed on first access)"""
+        index: dict[str, list[int]] = {}
+        for i, statement in enumerate(self.statements):
+            for word in set(_WORD.findall(statement.content_lower)):
+                index.setdefault(word, []).append(i)
+        return index
 
 
 # =============================================================================
@@ -98,11 +143,13 @@ class MeetingTranscript(BaseModel):
 
 class Evidence(BaseModel):
     """A piece of evidence from any source"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     type: EvidenceType
     source: str  # e.g., commit hash, transcript line
     summary: str
     strength: EvidenceStrength = EvidenceStrength.MODERATE
-    raw_data: Optional[dict] = None
+    raw_data: Optional[dict] = Field(default=None, exclude=True)  # internal only, never serialized
 
 
 class EvidenceCollection(BaseModel):
@@ -110,15 +157,58 @@ class EvidenceCollection(BaseModel):
     git_log: Optional[GitLog] = None
     transcripts: list[MeetingTranscript] = []
     
+    # Per-person indexes, built once at construction
+    _commits_by_author: dict[str, list[GitCommit]] = PrivateAttr(default_factory=dict)
+    _statements_by_speaker: dict[str, list[TranscriptStatement]] = PrivateAttr(default_factory=dict)
+    
+    def model_post_init(self, __context):
+        if self.git_log:
+            for commit in self.git_log.commits:
+                self._commits_by_author.setdefault(commit.author_name, []).append(commit)
+        for transcript in self.transcripts:
+            for statement in transcript.statements:
+                self._statements_by_speaker.setdefault(statement.speaker, []).append(statement)
+    
+    @property
+    def commits_by_author(self) -> dict[str, list[GitCommit]]:
+        """Commits grouped by author name"""
+        return self._commits_by_author
+    
     @property
+    def statements_by_speaker(self) -> dict[str, list[TranscriptStatement]]:
+        """Transcript statements grouped by speaker name"""
+        return self._statements_by_speaker
+    
+    @cached_property
     def all_contributors(self) -> list[str]:
-        """Get all unique contributors across sources"""
+        """
+        Get all unique contributors across sources.
+        
+        Cached on first access. Like the per-person indexes, this assumes the
+        collection is not modified after construction.
+        """
         contributors = set()
         if self.git_log:
             contributors.update(self.git_log.contributors)
         for t in self.transcripts:
             contributors.update(t.participants)
         return sorted(list(contributors))
+    
+    @cached_property
+    def contributor_index(self) -> tuple[list[str], list[str]]:
+        """Lowercased contributor names in sorted order, with the matching original names"""
+        pairs = sorted((name.lower(), name) for name in self.all_contributors)
+        return [key for key, _ in pairs], [name for _, name in pairs]
+    
+    def contributors_with_prefix(self, prefix: str) -> list[str]:
+        """Contributors whose lowercased name starts with `prefix` (lowercase), found by binary search"""
+        keys, names = self.contributor_index
+        matches = []
+        for i in range(bisect_left(keys, prefix), len(keys)):
+            if not keys[i].startswith(prefix):
+                break
+            matches.append(names[i])
+        return matches
 
 
 # =============================================================================
@@ -142,35 +232,41 @@ class VerificationVerdict(BaseModel):
     supporting_evidence: list[Evidence] = []
     counter_evidence: list[Evidence] = []
     missing_evidence: list[str] = []
+    # Set by the engine for final answers (a Gemini analysis, a decisive triage
+    # or heuristic mode without Gemini), never for heuristic fallbacks after a
+    # Gemini failure; not part of the API response
+    cacheable: bool = Field(default=False, exclude=True, repr=False)
+    
+    @field_serializer("verdict")
+    def _serialize_verdict(self, verdict: VerdictType) -> str:
+        return verdict.value.upper()
     
     def to_dict(self) -> dict:
         """Convert to dict for JSON response"""
-        return {
-            "claim": self.claim,
-            "claimant": self.claimant,
-            "verdict": self.verdict.value.upper(),
-            "confidence": self.confidence,
-            "explanation": self.explanation,
-            "supporting_evidence": [
-                {
-                    "type": e.type.value,
-                    "source": e.source,
-                    "summary": e.summary,
-                    "strength": e.strength.value
-                }
-                for e in self.supporting_evidence
-            ],
-            "counter_evidence": [
-                {
-                    "type": e.type.value,
-                    "source": e.source,
-                    "summary": e.summary,
-                    "strength": e.strength.value
-                }
-                for e in self.counter_evidence
-            ],
-            "missing_evidence": self.missing_evidence
-        }
+        return self.model_dump(mode="json")
+
+
+# =============================================================================
+# Gemini Structured Output Models
+# =============================================================================
+
+class EvidenceItem(BaseModel):
+    """A piece of evidence as reported by Gemini (Evidence without raw data)"""
+    type: EvidenceType
+    source: str
+    strength: EvidenceStrength
+    summary: str
+
+
+class DisprovalAnalysis(BaseModel):
+    """The complete disproval loop, returned by a single structured Gemini call"""
+    expected_evidence: list[str]
+    supporting_evidence: list[EvidenceItem]
+    counter_evidence: list[EvidenceItem]
+    missing_evidence: list[str]
+    verdict: VerdictType
+    confidence: float
+    explanation: str
 
 
 # =============================================================================
@@ -190,3 +286,12 @@ class UploadResponse(BaseModel):
     git_commits_parsed: int = 0
     transcript_statements_parsed: int = 0
     contributors_found: list[str] = []
+
+
+class EvidenceStatusResponse(BaseModel):
+    """Summary of the currently uploaded evidence"""
+    has_evidence: bool
+    git_commits: int = 0
+    transcript_statements: int = 0
+    contributors: list[str] = []
+    gemini_enabled: Optional[bool] = None
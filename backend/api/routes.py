@@ -3,19 +3,30 @@ API Routes - REST Endpoints
 Contribution Truth
 """
 
+import asyncio
+import codecs
+import hashlib
+import io
 import os
-from typing import Optional
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, Iterable, Iterator, Optional, Union
 
-from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi import APIRouter, File, HTTPException, Request, UploadFile
 
 from api.models import (
     EvidenceCollection,
+    EvidenceStatusResponse,
+    GitLog,
+    MeetingTranscript,
     UploadResponse,
+    VerificationVerdict,
     VerifyClaimRequest,
 )
 from ingestion.git_parser import parse_git_log
 from ingestion.transcript_parser import parse_transcript
-from analysis.claim_verifier import get_verification_engine
+from analysis.claim_verifier import ClaimVerificationEngine
 from analysis.gemini_client import is_gemini_configured
 
 
@@ -23,10 +34,146 @@ router = APIRouter(prefix="/api", tags=["Contribution Truth"])
 
 # In-memory evidence storage (for prototype)
 _current_evidence: Optional[EvidenceCollection] = None
+# Upload keys behind the current evidence, by slot ("git" or "transcript:<title>")
+_current_upload_keys: dict[str, str] = {}
+
+# Recently parsed uploads keyed by content signature, least recently used first
+PARSED_CACHE_SIZE = 5
+_parsed_uploads: OrderedDict[str, Union[GitLog, MeetingTranscript]] = OrderedDict()
+_parsed_uploads_lock = threading.Lock()  # uploads are parsed on worker threads
+
+# Recent verdicts keyed by evidence signature + normalized claim, least recently used first
+VERDICT_CACHE_SIZE = 128
+_verdict_cache: OrderedDict[str, VerificationVerdict] = OrderedDict()
+
+
+def _verdict_key(signature: Optional[str], claimant: str, claim: str) -> str:
+    """Cache key for a claim against a given evidence set, ignoring case and spacing."""
+    normalized_claimant = " ".join(claimant.lower().split())
+    normalized_claim = " ".join(claim.lower().split())
+    return hashlib.sha1(f"{signature}|{normalized_claimant}|{normalized_claim}".encode()).hexdigest()
+
+
+def _upload_signature(upload: UploadFile) -> str:
+    """SHA-1 of an upload's bytes, hashed from the spooled file without copying it."""
+    upload.file.seek(0)
+    # file_digest reads into one reusable buffer and hashes in C (OpenSSL)
+    signature = hashlib.file_digest(upload.file, "sha1").hexdigest()
+    upload.file.seek(0)
+    return signature
+
+
+def _parse_upload(
+    upload: UploadFile,
+    kind: str,
+    parse: Callable[[Iterable[str]], Union[GitLog, MeetingTranscript]]
+) -> tuple[str, Union[GitLog, MeetingTranscript]]:
+    """
+    Parse an upload, reusing the result if identical content was seen recently.
+    
+    Returns the upload's cache key (kind + content signature) and the parsed evidence.
+    """
+    key = f"{kind}:{_upload_signature(upload)}"
+    with _parsed_uploads_lock:
+        if key in _parsed_uploads:
+            _parsed_uploads.move_to_end(key)
+            return key, _parsed_uploads[key]
+    
+    # Parse straight from the spooled upload, a line at a time
+    lines = io.TextIOWrapper(upload.file, encoding='utf-8')
+    try:
+        parsed = parse(lines)
+    finally:
+        lines.detach()  # leave the file for Starlette to close
+    
+    _remember_parsed(key, parsed)
+    return key, parsed
+
+
+def _remember_parsed(key: str, parsed: Union[GitLog, MeetingTranscript]):
+    """Add parsed evidence to the LRU, evicting the least recently used entry."""
+    with _parsed_uploads_lock:
+        _parsed_uploads[key] = parsed
+        if len(_parsed_uploads) > PARSED_CACHE_SIZE:
+            _parsed_uploads.popitem(last=False)
+
+
+async def _parse_request_stream(
+    request: Request,
+    kind: str,
+    parse: Callable[[Iterable[str]], Union[GitLog, MeetingTranscript]]
+) -> tuple[str, Union[GitLog, MeetingTranscript]]:
+    """
+    Parse a raw request body while it is still arriving.
+    
+    Body chunks are handed to the parser (running on a worker thread) through
+    a bounded queue, so only a few chunks are ever buffered and nothing is
+    spooled to disk. Returns the same (key, parsed) pair as _parse_upload.
+    """
+    loop = asyncio.get_running_loop()
+    chunks: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize=10)
+    digest = hashlib.sha1()
+    
+    def lines() -> Iterator[str]:
+        # Lines keep their '\n' like a file's, so the JSON parser can tell a
+        # malformed line (complete, to be skipped) from an incomplete one
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        pending = ''
+        while (chunk := asyncio.run_coroutine_threadsafe(chunks.get(), loop).result()) is not None:
+            *complete, pending = (pending + decoder.decode(chunk)).split('\n')
+            for line in complete:
+                yield line + '\n'
+        pending += decoder.decode(b'', final=True)
+        if pending:
+            yield pending
+    
+    parse_task = loop.run_in_executor(None, lambda: parse(lines()))
+    
+    async def feed(chunk: Optional[bytes]) -> bool:
+        """Queue a chunk for the parser; False if the parser stopped first."""
+        put = asyncio.ensure_future(chunks.put(chunk))
+        await asyncio.wait((put, parse_task), return_when=asyncio.FIRST_COMPLETED)
+        if put.done():
+            return True
+        put.cancel()
+        return False
+    
+    try:
+        async for chunk in request.stream():
+            digest.update(chunk)
+            if not await feed(chunk):
+                break
+        await feed(None)
+    except BaseException:
+        # The client went away mid-upload: unblock the parser thread
+        while not chunks.empty():
+            chunks.get_nowait()
+        chunks.put_nowait(None)
+        raise
+    
+    parsed = await parse_task
+    key = f"{kind}:{digest.hexdigest()}"
+    _remember_parsed(key, parsed)
+    return key, parsed
+
+
+def _set_current_evidence(
+    engine: ClaimVerificationEngine,
+    evidence: EvidenceCollection,
+    upload_keys: dict[str, str]
+):
+    """Store evidence and set it on the verification engine, keyed by its uploads."""
+    global _current_evidence, _current_upload_keys
+    _current_evidence = evidence
+    _current_upload_keys = upload_keys
+    
+    signature = hashlib.sha1("|".join(upload_keys.values()).encode()).hexdigest()
+    engine.set_evidence(evidence, signature=signature)
 
 
 @router.post("/evidence/upload", response_model=UploadResponse)
 async def upload_evidence(
+    request: Request,
     git_log: Optional[UploadFile] = File(None),
     transcript: Optional[UploadFile] = File(None)
 ):
@@ -37,40 +184,36 @@ async def upload_evidence(
     - git_log: JSON or text output from git log
     - transcript: Meeting transcript with speaker attribution
     """
-    global _current_evidence
-    
     if not git_log and not transcript:
         raise HTTPException(status_code=400, detail="At least one file must be uploaded")
     
-    evidence = EvidenceCollection()
-    git_commits_parsed = 0
-    transcript_statements_parsed = 0
-    
-    # Parse git log
+    # Parse both files concurrently on worker threads, keeping the event loop free
+    loop = asyncio.get_running_loop()
+    tasks = {}
     if git_log:
-        try:
-            content = await git_log.read()
-            content_str = content.decode('utf-8')
-            evidence.git_log = parse_git_log(content_str)
-            git_commits_parsed = len(evidence.git_log.commits)
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Failed to parse git log: {str(e)}")
-    
-    # Parse transcript
+        tasks["git log"] = loop.run_in_executor(None, _parse_upload, git_log, "git", parse_git_log)
     if transcript:
-        try:
-            content = await transcript.read()
-            content_str = content.decode('utf-8')
-            parsed = parse_transcript(content_str, title=transcript.filename or "Meeting")
-            evidence.transcripts.append(parsed)
-            transcript_statements_parsed = len(parsed.statements)
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Failed to parse transcript: {str(e)}")
+        title = transcript.filename or "Meeting"
+        tasks["transcript"] = loop.run_in_executor(
+            None, _parse_upload, transcript, f"transcript:{title}", partial(parse_transcript, title=title)
+        )
+    results = dict(zip(tasks, await asyncio.gather(*tasks.values(), return_exceptions=True)))
+    
+    for name, result in results.items():
+        if isinstance(result, Exception):
+            raise HTTPException(status_code=400, detail=f"Failed to parse {name}: {str(result)}")
+    
+    parsed_git_log = results["git log"][1] if git_log else None
+    transcripts = [results["transcript"][1]] if transcript else []
+    upload_keys = {key.rsplit(":", 1)[0]: key for key, _ in results.values()}
+    git_commits_parsed = len(parsed_git_log.commits) if parsed_git_log else 0
+    transcript_statements_parsed = sum(len(t.statements) for t in transcripts)
+    
+    # Build the collection in one go so its per-person indexes cover everything
+    evidence = EvidenceCollection(git_log=parsed_git_log, transcripts=transcripts)
     
     # Store evidence and set on verification engine
-    _current_evidence = evidence
-    engine = get_verification_engine()
-    engine.set_evidence(evidence)
+    _set_current_evidence(request.app.state.engine, evidence, upload_keys)
     
     return UploadResponse(
         success=True,
@@ -81,8 +224,68 @@ async def upload_evidence(
     )
 
 
-@router.post("/verify")
-async def verify_claim(request: VerifyClaimRequest):
+@router.put("/evidence/git", response_model=UploadResponse)
+async def put_git_log(request: Request):
+    """
+    Upload a git log (JSON or text output from git log) as the raw request body.
+    
+    The body is parsed as it streams in. Replaces the current git log and keeps
+    any uploaded transcripts.
+    """
+    try:
+        key, parsed_git_log = await _parse_request_stream(request, "git", parse_git_log)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to parse git log: {str(e)}")
+    
+    transcripts = _current_evidence.transcripts if _current_evidence else []
+    evidence = EvidenceCollection(git_log=parsed_git_log, transcripts=transcripts)
+    _set_current_evidence(request.app.state.engine, evidence, {**_current_upload_keys, "git": key})
+    
+    return UploadResponse(
+        success=True,
+        message="Git log uploaded and parsed successfully",
+        git_commits_parsed=len(parsed_git_log.commits),
+        transcript_statements_parsed=0,
+        contributors_found=evidence.all_contributors
+    )
+
+
+@router.put("/evidence/transcript", response_model=UploadResponse)
+async def put_transcript(request: Request, title: str = "Meeting"):
+    """
+    Upload a meeting transcript as the raw request body.
+    
+    The body is parsed as it streams in. Replaces any transcript with the same
+    title and keeps the rest of the evidence.
+    """
+    slot = f"transcript:{title}"
+    try:
+        key, parsed = await _parse_request_stream(
+            request, slot, partial(parse_transcript, title=title)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to parse transcript: {str(e)}")
+    
+    git_log = _current_evidence.git_log if _current_evidence else None
+    transcripts = [t for t in _current_evidence.transcripts if t.title != title] if _current_evidence else []
+    evidence = EvidenceCollection(git_log=git_log, transcripts=[*transcripts, parsed])
+    _set_current_evidence(request.app.state.engine, evidence, {**_current_upload_keys, slot: key})
+    
+    return UploadResponse(
+        success=True,
+        message="Transcript uploaded and parsed successfully",
+        git_commits_parsed=0,
+        transcript_statements_parsed=len(parsed.statements),
+        contributors_found=evidence.all_contributors
+    )
+
+
+@router.post("/verify", response_model=VerificationVerdict)
+async def verify_claim(claim_request: VerifyClaimRequest, request: Request):
     """
     Verify a contribution claim against uploaded evidence.
     
@@ -99,57 +302,66 @@ async def verify_claim(request: VerifyClaimRequest):
             detail="No evidence uploaded. Please upload git logs and/or transcripts first."
         )
     
-    if not request.claimant or not request.claim:
+    if not claim_request.claimant or not claim_request.claim:
         raise HTTPException(
             status_code=400,
             detail="Both claimant name and claim text are required."
         )
     
-    engine = get_verification_engine()
+    engine = request.app.state.engine
+    
+    key = _verdict_key(engine.evidence_signature, claim_request.claimant, claim_request.claim)
+    if key in _verdict_cache:
+        _verdict_cache.move_to_end(key)
+        return _verdict_cache[key]
     
     try:
         verdict = await engine.verify_claim(
-            claimant=request.claimant,
-            claim=request.claim
+            claimant=claim_request.claimant,
+            claim=claim_request.claim
         )
-        return verdict.to_dict()
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Verification failed: {str(e)}"
         )
+    
+    # Heuristic fallbacks (rate limits, Gemini errors, invalid responses) are
+    # temporary; only final verdicts are cached so a retry can reach Gemini
+    if verdict.cacheable:
+        _verdict_cache[key] = verdict
+        if len(_verdict_cache) > VERDICT_CACHE_SIZE:
+            _verdict_cache.popitem(last=False)
+    return verdict
 
 
-@router.get("/evidence/status")
+@router.get("/evidence/status", response_model=EvidenceStatusResponse, response_model_exclude_none=True)
 async def evidence_status():
     """Get the current status of uploaded evidence."""
     global _current_evidence
     
     if not _current_evidence:
-        return {
-            "has_evidence": False,
-            "git_commits": 0,
-            "transcript_statements": 0,
-            "contributors": []
-        }
+        return EvidenceStatusResponse(has_evidence=False)
     
     transcript_statements = sum(
         len(t.statements) for t in _current_evidence.transcripts
     )
     
-    return {
-        "has_evidence": True,
-        "git_commits": len(_current_evidence.git_log.commits) if _current_evidence.git_log else 0,
-        "transcript_statements": transcript_statements,
-        "contributors": _current_evidence.all_contributors,
-        "gemini_enabled": is_gemini_configured()
-    }
+    return EvidenceStatusResponse(
+        has_evidence=True,
+        git_commits=len(_current_evidence.git_log.commits) if _current_evidence.git_log else 0,
+        transcript_statements=transcript_statements,
+        contributors=_current_evidence.all_contributors,
+        gemini_enabled=is_gemini_configured()
+    )
 
 
 @router.delete("/evidence/clear")
 async def clear_evidence():
     """Clear all uploaded evidence."""
-    global _current_evidence
+    global _current_evidence, _current_upload_keys
     _current_evidence = None
+    _current_upload_keys = {}
+    _verdict_cache.clear()
     
     return {"success": True, "message": "Evidence cleared"}
@@ -5,68 +5,177 @@ Contribution Truth
 Parses git log output in various formats and normalizes to internal model.
 """
 
+import codecs
 import json
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Optional
+from itertools import chain
+from typing import IO, Any, Iterable, Iterator, Optional, Union
+
+import orjson
 
 from api.models import GitCommit, GitFileChange, GitLog
 
 
-def parse_git_log_json(content: str) -> GitLog:
+# Key names used for each field by the various git log JSON exporters
+_HASH_KEYS = ('hash', 'commit', 'sha')
+_AUTHOR_KEYS = ('author', 'author_name')
+_EMAIL_KEYS = ('email', 'author_email')
+_MESSAGE_KEYS = ('message', 'subject', 'title')
+_DATE_KEYS = ('date', 'timestamp', 'authored_date')
+_FILENAME_KEYS = ('filename', 'name', 'path')
+
+
+# Oneline format: "abc1234 Author Name - Commit message"
+_ONELINE = re.compile(r'^([a-f0-9]{7,40})\s+(.+?)\s*-\s*(.+)$', re.IGNORECASE)
+# Standard format author line: "Author: Name <email>"
+_AUTHOR_LINE = re.compile(r'Author:\s*(.+?)\s*<(.+?)>')
+# Whitespace, commas and array brackets between streamed JSON commit objects
+_JSON_SEPARATORS = re.compile(r'[\s,\[\]]*')
+
+
+def _first(item: dict, keys: tuple[str, ...], default: Any = None) -> Any:
+    """Return the first truthy value among `keys`, else `default`."""
+    for key in keys:
+        value = item.get(key)
+        if value:
+            return value
+    return default
+
+
+def parse_git_log_json(content: Union[str, bytes]) -> GitLog:
     """
     Parse git log output in JSON format.
     
     Expected format from: git log --pretty=format:'{"hash":"%H","author":"%an","email":"%ae","date":"%aI","message":"%s"},'
     
     Or a JSON array of commit objects.
+    
+    Commits repeated with the same hash (concatenated or merged logs) are kept once.
+    Raw UTF-8 bytes are handed to orjson as-is, without decoding to str first.
     """
-    commits = []
+    if isinstance(content, (bytes, bytearray)):
+        comma, newline, open_bracket, close_bracket = b',', b'\n', b'[', b']'
+    else:
+        comma, newline, open_bracket, close_bracket = ',', '\n', '[', ']'
     
     # Try parsing as JSON array first
     try:
         # Clean up common issues with git log JSON output
         content = content.strip()
-        if content.endswith(','):
+        if content.endswith(comma):
             content = content[:-1]
-        if not content.startswith('['):
-            content = '[' + content + ']'
-        
-        data = json.loads(content)
+        if not content.startswith(open_bracket):
+            content = open_bracket + content + close_bracket
         
-        for item in data:
-            commit = _parse_commit_object(item)
-            if commit:
-                commits.append(commit)
+        items = orjson.loads(content)
                 
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         # Fall back to line-by-line JSON parsing
-        for line in content.strip().split('\n'):
-            line = line.strip().rstrip(',')
+        items = []
+        for line in content.strip().split(newline):
+            line = line.strip().rstrip(comma)
             if not line:
                 continue
             try:
-                item = json.loads(line)
-                commit = _parse_commit_object(item)
-                if commit:
-                    commits.append(commit)
-            except json.JSONDecodeError:
+                items.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
                 continue
     
-    return GitLog(commits=commits)
+    return GitLog(commits=list(_unique_commits(items)))
+
+
+def parse_git_log_json_stream(
+    source: Union[str, bytes, IO, Iterable[Union[str, bytes]]],
+    chunk_size: int = 64 * 1024
+) -> GitLog:
+    """
+    Parse JSON git log output incrementally.
+    
+    Accepts the same formats as parse_git_log_json, from a string, bytes, an open
+    file (text or binary) or any iterable of chunks. Commit objects are decoded
+    and converted one at a time, so the raw JSON list is never held in memory.
+    Undecodable input is skipped up to the next newline.
+    """
+    if isinstance(source, (str, bytes, bytearray)):
+        chunks = iter([source])
+    elif hasattr(source, 'read'):
+        chunks = iter(lambda: source.read(chunk_size) or None, None)
+    else:
+        chunks = iter(source)
+    
+    return GitLog(commits=list(_unique_commits(_iter_json_objects(chunks))))
+
+
+def _iter_json_objects(chunks: Iterator[Union[str, bytes]]) -> Iterator[Any]:
+    """Yield each top-level JSON value from a stream of text or UTF-8 byte chunks."""
+    decode = json.JSONDecoder().raw_decode
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    pos = 0
+    eof = False
+    
+    while True:
+        pos = _JSON_SEPARATORS.match(buffer, pos).end()
+        if pos < len(buffer):
+            try:
+                item, pos = decode(buffer, pos)
+            except json.JSONDecodeError as error:
+                # JSON strings can't span lines, so an error on a line that is
+                # already complete is malformed input rather than an object cut
+                # off by the chunk boundary: drop the rest of that line now
+                # instead of buffering the remaining input behind it
+                newline = buffer.find('\n', error.pos)
+                if newline != -1:
+                    pos = newline + 1
+                    continue
+                if eof:
+                    return
+            else:
+                yield item
+                continue
+        elif eof:
+            return
+        
+        # The next object is incomplete (or the buffer is empty): read more
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+            chunk = utf8.decode(b'', final=True)
+        elif isinstance(chunk, (bytes, bytearray)):
+            chunk = utf8.decode(chunk)
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+
+def _unique_commits(items: Iterable[Any]) -> Iterator[GitCommit]:
+    """Convert commit objects, keeping only the first commit seen for each hash."""
+    seen_hashes = set()
+    for item in items:
+        hash_val = _first(item, _HASH_KEYS) if isinstance(item, dict) else None
+        if hash_val:
+            if hash_val in seen_hashes:
+                continue
+            seen_hashes.add(hash_val)
+        commit = _parse_commit_object(item)
+        if commit:
+            yield commit
 
 
 def _parse_commit_object(item: dict) -> Optional[GitCommit]:
     """Parse a single commit object from JSON"""
     try:
         # Handle various key names
-        hash_val = item.get('hash') or item.get('commit') or item.get('sha') or ''
-        author = item.get('author') or item.get('author_name') or 'Unknown'
-        email = item.get('email') or item.get('author_email') or ''
-        message = item.get('message') or item.get('subject') or item.get('title') or ''
+        hash_val = _first(item, _HASH_KEYS, '')
+        author = _first(item, _AUTHOR_KEYS, 'Unknown')
+        email = _first(item, _EMAIL_KEYS, '')
+        message = _first(item, _MESSAGE_KEYS, '')
         
         # Parse date
-        date_str = item.get('date') or item.get('timestamp') or item.get('authored_date')
+        date_str = _first(item, _DATE_KEYS)
         if isinstance(date_str, str):
             timestamp = _parse_date(date_str)
         elif isinstance(date_str, (int, float)):
@@ -82,7 +191,7 @@ def _parse_commit_object(item: dict) -> Optional[GitCommit]:
                     files.append(GitFileChange(filename=f))
                 elif isinstance(f, dict):
                     files.append(GitFileChange(
-                        filename=f.get('filename') or f.get('name') or f.get('path', ''),
+                        filename=_first(f, _FILENAME_KEYS, ''),
                         additions=f.get('additions', 0),
                         deletions=f.get('deletions', 0),
                         status=f.get('status', 'modified')
@@ -90,8 +199,8 @@ def _parse_commit_object(item: dict) -> Optional[GitCommit]:
         
         return GitCommit(
             hash=hash_val,
-            author_name=author,
-            author_email=email,
+            author_name=sys.intern(author),
+            author_email=sys.intern(email),
             timestamp=timestamp,
             message=message,
             files_changed=files
@@ -101,31 +210,31 @@ def _parse_commit_object(item: dict) -> Optional[GitCommit]:
         return None
 
 
-def parse_git_log_text(content: str) -> GitLog:
+def parse_git_log_text(content: Union[str, Iterable[str]]) -> GitLog:
     """
     Parse git log output in standard text format.
     
     Expected format from: git log --oneline or git log
+    
+    Accepts the whole log as a string or any iterable of lines (e.g. an open
+    file), which is consumed one line at a time.
     """
     commits = []
     current_commit = {}
     
-    lines = content.strip().split('\n')
-    
-    # Try oneline format first: "abc1234 Author Name - Commit message"
-    oneline_pattern = re.compile(r'^([a-f0-9]{7,40})\s+(.+?)\s*-\s*(.+)$', re.IGNORECASE)
+    lines = content.split('\n') if isinstance(content, str) else content
     
     for line in lines:
         line = line.strip()
         if not line:
             continue
         
-        # Check for oneline format
-        match = oneline_pattern.match(line)
+        # Check for oneline format first
+        match = _ONELINE.match(line)
         if match:
             commits.append(GitCommit(
                 hash=match.group(1),
-                author_name=match.group(2).strip(),
+                author_name=sys.intern(match.group(2).strip()),
                 timestamp=datetime.now(),  # Not available in oneline
                 message=match.group(3).strip()
             ))
@@ -137,7 +246,7 @@ def parse_git_log_text(content: str) -> GitLog:
                 commits.append(_create_commit_from_dict(current_commit))
             current_commit = {'hash': line[7:].strip()}
         elif line.startswith('Author:'):
-            author_match = re.match(r'Author:\s*(.+?)\s*<(.+?)>', line)
+            author_match = _AUTHOR_LINE.match(line)
             if author_match:
                 current_commit['author'] = author_match.group(1).strip()
                 current_commit['email'] = author_match.group(2).strip()
@@ -146,11 +255,8 @@ def parse_git_log_text(content: str) -> GitLog:
         elif line.startswith('Date:'):
             current_commit['date'] = line[5:].strip()
         elif line and not line.startswith('Merge:'):
-            # This is likely the commit message
-            if 'message' in current_commit:
-                current_commit['message'] += ' ' + line
-            else:
-                current_commit['message'] = line
+            # This is likely the commit message; joined once the commit is complete
+            current_commit.setdefault('message_parts', []).append(line)
     
     # Don't forget the last commit
     if current_commit.get('hash'):
@@ -167,44 +273,98 @@ def _create_commit_from_dict(data: dict) -> GitCommit:
     
     return GitCommit(
         hash=data.get('hash', ''),
-        author_name=data.get('author', 'Unknown'),
-        author_email=data.get('email', ''),
+        author_name=sys.intern(data.get('author', 'Unknown')),
+        author_email=sys.intern(data.get('email', '')),
         timestamp=timestamp,
-        message=data.get('message', '').strip()
+        message=' '.join(data.get('message_parts', ())).strip()
     )
 
 
+_DATE_FORMATS = (
+    '%Y-%m-%dT%H:%M:%S%z',  # ISO format with timezone
+    '%Y-%m-%dT%H:%M:%S',    # ISO format without timezone
+    '%a %b %d %H:%M:%S %Y %z',  # Git default format
+    '%a %b %d %H:%M:%S %Y',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d',
+)
+
+# Logs use one date format throughout, so the last format that worked is tried first
+_last_date_format: Optional[str] = None
+
+
 def _parse_date(date_str: str) -> datetime:
     """Try to parse a date string in various formats"""
-    formats = [
-        '%Y-%m-%dT%H:%M:%S%z',  # ISO format with timezone
-        '%Y-%m-%dT%H:%M:%S',    # ISO format without timezone
-        '%a %b %d %H:%M:%S %Y %z',  # Git default format
-        '%a %b %d %H:%M:%S %Y',
-        '%Y-%m-%d %H:%M:%S',
-        '%Y-%m-%d',
-    ]
-    
-    for fmt in formats:
+    global _last_date_format
+    date_str = date_str.strip()
+    
+    # ISO 8601 (including a trailing "Z") is parsed in C and fails fast otherwise,
+    # so it goes before any strptime attempt
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+    
+    if _last_date_format:
+        try:
+            return datetime.strptime(date_str, _last_date_format)
+        except ValueError:
+            pass
+    
+    for fmt in _DATE_FORMATS:
         try:
-            return datetime.strptime(date_str.strip(), fmt)
+            parsed = datetime.strptime(date_str, fmt)
         except ValueError:
             continue
+        _last_date_format = fmt
+        return parsed
     
     return datetime.now()
 
 
-def parse_git_log(content: str) -> GitLog:
+def parse_git_log(content: Union[str, bytes, Iterable[str]]) -> GitLog:
     """
     Auto-detect format and parse git log.
     
-    Tries JSON first, then falls back to text format.
+    Tries JSON first, then falls back to text format. Accepts a string, UTF-8
+    bytes or an iterable of lines; text logs are parsed as the lines arrive.
+    """
+    if isinstance(content, (bytes, bytearray)):
+        content = content.strip()
+        if content.startswith((b'{', b'[')):
+            return parse_git_log_json(content)
+        return parse_git_log_text(content.decode('utf-8'))
+    
+    if isinstance(content, str):
+        content = content.strip()
+        
+        # Check if it looks like JSON
+        if content.startswith('{') or content.startswith('['):
+            return parse_git_log_json(content)
+        
+        # Otherwise parse as text
+        return parse_git_log_text(content)
+    
+    # Peek at the first non-blank line to detect the format
+    lines = iter(content)
+    first_line = next((line for line in lines if line.strip()), '')
+    if first_line.lstrip().startswith(('{', '[')):
+        return parse_git_log_json_stream(chain([first_line], lines))
+    return parse_git_log_text(chain([first_line], lines))
+
+
+def parse_git_logs_parallel(contents: list[Union[str, bytes]], max_workers: Optional[int] = None) -> list[GitLog]:
     """
-    content = content.strip()
+    Parse several git logs at once, one worker process per log.
     
-    # Check if it looks like JSON
-    if content.startswith('{') or content.startswith('['):
-        return parse_git_log_json(content)
+    Parsing is CPU-bound and holds the GIL, so separate logs (e.g. one per
+    repository) are spread over a process pool; results keep the input order.
+    A single log is parsed in-process, since starting workers would cost more
+    than it saves.
+    """
+    if len(contents) < 2:
+        return [parse_git_log(content) for content in contents]
     
-    # Otherwise parse as text
-    return parse_git_log_text(content)
+    workers = min(len(contents), max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_git_log, contents))
@@ -5,14 +5,69 @@ Contribution Truth
 Parses meeting transcripts with speaker attribution.
 """
 
+import functools
 import re
+import sys
+from collections import Counter
 from datetime import datetime
-from typing import Optional
+from itertools import dropwhile
+from typing import Iterable, Optional, Union
 
 from api.models import MeetingTranscript, TranscriptStatement
 
 
-def parse_transcript(content: str, title: str = "Meeting") -> MeetingTranscript:
+# Speaker attribution formats, keyed by the group that ends each one (the
+# match's lastgroup)
+_SPEAKER_FORMATS = {
+    # "[HH:MM:SS] Speaker: message" or "[HH:MM] Speaker: message"
+    'ts_message': r'\[?(?P<timestamp>\d{1,2}:\d{2}(?::\d{2})?)\]?\s*(?P<ts_speaker>[^:\[\]]+?):\s*(?P<ts_message>.+)',
+    # "Speaker: message"
+    'message': r'(?P<speaker>[^:\[\]]{2,30}):\s*(?P<message>.+)',
+    # "[Speaker] message"
+    'bracket_message': r'\[(?P<bracket_speaker>[^\]]+)\]\s*(?P<bracket_message>.+)',
+    # "Speaker - message"
+    'dash_message': r'(?P<dash_speaker>[^-]{2,30})\s*-\s*(?P<dash_message>.+)',
+}
+
+
+def _speaker_pattern(first: Optional[str] = None) -> re.Pattern:
+    """
+    All speaker formats fused into one pattern, optionally with one format tried
+    first after the timestamped one (which always leads, or its lines would be
+    split at the timestamp's colon).
+    """
+    order = sorted(_SPEAKER_FORMATS, key=lambda name: (name != 'ts_message', name != first))
+    return re.compile(r'^(?:' + '|'.join(_SPEAKER_FORMATS[name] for name in order) + r')$')
+
+
+# Alternatives are tried in order, so earlier formats win just as with separate patterns
+_SPEAKER_LINE = _speaker_pattern()
+# Once a transcript's format is known its alternative goes first, so most lines
+# match without trying (and backtracking through) the others. A dash-format
+# match whose speaker holds a ':' or '[' is re-read with _SPEAKER_LINE: that
+# separator comes first on the line, so the line is in the other format.
+_SPEAKER_LINE_BY_FORMAT = {name: _speaker_pattern(name) for name in _SPEAKER_FORMATS}
+# Speaker lines sampled to detect the format
+_FORMAT_SAMPLE_LINES = 5
+
+# Metadata lines; dates/times and separators only count at the start of a line
+# so statements like "Bob: let's fix the due date: Friday" are kept. Checked
+# with str methods on the lowercased line: an unanchored case-insensitive regex
+# scan over every line was the slowest step of parsing.
+_HEADER_KEYWORDS = ('meeting transcript', 'meeting notes', 'attendees:', 'participants:', 'location:')
+_HEADER_PREFIXES = ('date:', 'time:', '---', '===', '***')
+
+_TITLE_PREFIX = re.compile(r'^(?:Dr|Mr|Mrs|Ms|Prof)\.\s*')
+
+# Date patterns paired with the format that parses them, in priority order
+_DATE_PATTERNS = (
+    (re.compile(r'(\d{4}-\d{2}-\d{2})'), '%Y-%m-%d'),  # 2024-01-15
+    (re.compile(r'(\d{2}/\d{2}/\d{4})'), '%m/%d/%Y'),  # 01/15/2024
+    (re.compile(r'(\d{2}-\d{2}-\d{4})'), '%m-%d-%Y'),  # 01-15-2024
+)
+
+
+def parse_transcript(content: Union[str, Iterable[str]], title: str = "Meeting") -> MeetingTranscript:
     """
     Parse a meeting transcript with speaker attribution.
     
@@ -21,94 +76,94 @@ def parse_transcript(content: str, title: str = "Meeting") -> MeetingTranscript:
     2. "[Speaker] message" format
     3. "Speaker - message" format
     4. Timestamped: "[HH:MM:SS] Speaker: message"
+    
+    Accepts the whole transcript as a string or any iterable of lines (e.g. an
+    open file), which is consumed one line at a time.
+    
+    The most common format among the first few speaker lines is taken as the
+    transcript's format and tried first from then on, so a line that fits it
+    (e.g. "Bob - ratio is 3:1" in a dash-format transcript) is read that way.
+    Timestamped lines and lines whose first separator belongs to another format
+    (e.g. "Bob: ratio a-b") are still read in the usual priority order.
     """
     statements = []
     current_speaker = None
     current_content = []
     line_number = 0
+    last_line_number = 0
     meeting_date = None
+    format_votes: Optional[Counter] = Counter()
+    # Hot-loop lookups bound to locals
+    match_speaker = _SPEAKER_LINE.match
+    is_header_line = _is_header_line
+    add_statement = statements.append
     
-    lines = content.strip().split('\n')
-    
-    # Try to extract date from first few lines
-    for line in lines[:5]:
-        date = _extract_date(line)
-        if date:
-            meeting_date = date
-            break
-    
-    # Patterns for speaker attribution
-    patterns = [
-        # "[HH:MM:SS] Speaker: message" or "[HH:MM] Speaker: message"
-        re.compile(r'^\[?(\d{1,2}:\d{2}(?::\d{2})?)\]?\s*([^:\[\]]+?):\s*(.+)$'),
-        # "Speaker: message"
-        re.compile(r'^([^:\[\]]{2,30}):\s*(.+)$'),
-        # "[Speaker] message"
-        re.compile(r'^\[([^\]]+)\]\s*(.+)$'),
-        # "Speaker - message"
-        re.compile(r'^([^-]{2,30})\s*-\s*(.+)$'),
-    ]
+    lines = content.splitlines() if isinstance(content, str) else content
+    # Line numbers count from the first non-blank line
+    lines = dropwhile(lambda line: not line.strip(), lines)
     
     for line in lines:
         line_number += 1
         line = line.strip()
         
+        # Try to extract date from first few lines
+        if meeting_date is None and line_number <= 5:
+            meeting_date = _extract_date(line)
+        
         if not line:
             continue
+        last_line_number = line_number
         
         # Skip header-like lines
-        if _is_header_line(line):
+        if is_header_line(line):
             continue
         
-        # Try each pattern
-        matched = False
-        for pattern in patterns:
-            match = pattern.match(line)
-            if match:
-                # Save previous speaker's content
-                if current_speaker and current_content:
-                    statements.append(TranscriptStatement(
-                        speaker=_normalize_speaker(current_speaker),
-                        content=' '.join(current_content),
-                        line_number=line_number - len(current_content)
-                    ))
-                    current_content = []
-                
-                groups = match.groups()
-                if len(groups) == 3:
-                    # Timestamped format
-                    timestamp, speaker, message = groups
-                    statements.append(TranscriptStatement(
-                        speaker=_normalize_speaker(speaker),
-                        content=message.strip(),
-                        timestamp=timestamp,
-                        line_number=line_number
-                    ))
-                    current_speaker = None
-                    current_content = []
-                else:
-                    # Non-timestamped format
-                    speaker, message = groups
-                    current_speaker = speaker
-                    current_content = [message.strip()]
-                
-                matched = True
-                break
-        
-        if not matched:
-            # Continuation of previous speaker's message
-            if current_speaker:
-                current_content.append(line)
+        match = match_speaker(line)
+        if match and match.lastgroup == 'dash_message':
+            dash_speaker = match['dash_speaker']
+            if ':' in dash_speaker or '[' in dash_speaker:
+                match = _SPEAKER_LINE.match(line)
+        if match:
+            if format_votes is not None:
+                format_votes[match.lastgroup] += 1
+                if format_votes.total() >= _FORMAT_SAMPLE_LINES:
+                    match_speaker = _SPEAKER_LINE_BY_FORMAT[format_votes.most_common(1)[0][0]].match
+                    format_votes = None
+            
+            # Save previous speaker's content
+            if current_speaker and current_content:
+                add_statement(TranscriptStatement(
+                    speaker=_normalize_speaker(current_speaker),
+                    content=' '.join(current_content),
+                    line_number=line_number - len(current_content)
+                ))
+                current_content = []
+            
+            if match['timestamp']:
+                # Timestamped format
+                add_statement(TranscriptStatement(
+                    speaker=_normalize_speaker(match['ts_speaker']),
+                    content=match['ts_message'].strip(),
+                    timestamp=match['timestamp'],
+                    line_number=line_number
+                ))
+                current_speaker = None
+                current_content = []
             else:
-                # Standalone line, attribute to "Unknown" or skip
-                pass
+                # Non-timestamped format
+                current_speaker = match['speaker'] or match['bracket_speaker'] or match['dash_speaker']
+                message = match['message'] or match['bracket_message'] or match['dash_message']
+                current_content = [message.strip()]
+        elif current_speaker:
+            # Continuation of previous speaker's message
+            current_content.append(line)
     
     # Don't forget the last statement
     if current_speaker and current_content:
         statements.append(TranscriptStatement(
             speaker=_normalize_speaker(current_speaker),
             content=' '.join(current_content),
-            line_number=line_number - len(current_content) + 1
+            line_number=last_line_number - len(current_content) + 1
         ))
     
     return MeetingTranscript(
@@ -118,53 +173,28 @@ def parse_transcript(content: str, title: str = "Meeting") -> MeetingTranscript:
     )
 
 
+@functools.lru_cache(maxsize=1024)
 def _normalize_speaker(speaker: str) -> str:
-    """Normalize speaker name"""
-    speaker = speaker.strip()
+    """Normalize speaker name (interned, so every statement by a speaker shares one string)"""
     # Remove common prefixes
-    prefixes = ['Dr.', 'Mr.', 'Mrs.', 'Ms.', 'Prof.']
-    for prefix in prefixes:
-        if speaker.startswith(prefix):
-            speaker = speaker[len(prefix):].strip()
-    return speaker.title()
+    return sys.intern(_TITLE_PREFIX.sub('', speaker.strip()).strip().title())
 
 
 def _is_header_line(line: str) -> bool:
     """Check if a line is a header/metadata line"""
-    header_indicators = [
-        'meeting transcript',
-        'meeting notes',
-        'attendees:',
-        'participants:',
-        'date:',
-        'time:',
-        'location:',
-        '---',
-        '===',
-        '***',
-    ]
     line_lower = line.lower()
-    return any(ind in line_lower for ind in header_indicators)
+    return line_lower.startswith(_HEADER_PREFIXES) or any(keyword in line_lower for keyword in _HEADER_KEYWORDS)
 
 
 def _extract_date(line: str) -> Optional[datetime]:
     """Try to extract a date from a line"""
-    # Common date patterns
-    patterns = [
-        r'(\d{4}-\d{2}-\d{2})',  # 2024-01-15
-        r'(\d{2}/\d{2}/\d{4})',  # 01/15/2024
-        r'(\d{2}-\d{2}-\d{4})',  # 01-15-2024
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, line)
+    for pattern, fmt in _DATE_PATTERNS:
+        match = pattern.search(line)
         if match:
-            date_str = match.group(1)
-            for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%m-%d-%Y']:
-                try:
-                    return datetime.strptime(date_str, fmt)
-                except ValueError:
-                    continue
+            try:
+                return datetime.strptime(match.group(1), fmt)
+            except ValueError:
+                continue
     
     return None
 
@@ -173,16 +203,25 @@ def extract_speaker_mentions(transcript: MeetingTranscript, name: str) -> list[T
     """
     Extract all statements where a specific person is mentioned.
     
-    Useful for finding evidence of someone's involvement.
+    Useful for finding evidence of someone's involvement. Matches whole words
+    only, so "Al" does not match "Alice". Candidates come from the transcript's
+    word index, so only statements containing every word of the name are searched.
     """
     name_lower = name.lower()
-    mentions = []
+    # Lookarounds rather than \b, which never matches after a name ending in
+    # punctuation such as "Bob M."
+    mention = re.compile(rf'(?<!\w){re.escape(name_lower)}(?!\w)')
+    statements = transcript.statements
+    words = set(re.findall(r'\w+', name_lower))
+    if not words:
+        return [s for s in statements if mention.search(s.content_lower)]
     
-    for statement in transcript.statements:
-        if name_lower in statement.content.lower():
-            mentions.append(statement)
+    index = transcript.word_index
+    candidates = set(index.get(words.pop(), ()))
+    for word in words:
+        candidates.intersection_update(index.get(word, ()))
     
-    return mentions
+    return [statements[i] for i in sorted(candidates) if mention.search(statements[i].content_lower)]
 
 
 def get_speaker_summary(transcript: MeetingTranscript) -> dict[str, dict]:
@@ -191,18 +230,11 @@ def get_speaker_summary(transcript: MeetingTranscript) -> dict[str, dict]:
     
     Returns dict with speaker names as keys and summary stats as values.
     """
-    summary = {}
-    
-    for statement in transcript.statements:
-        speaker = statement.speaker
-        if speaker not in summary:
-            summary[speaker] = {
-                'statement_count': 0,
-                'total_words': 0,
-                'topics_discussed': []
-            }
-        
-        summary[speaker]['statement_count'] += 1
-        summary[speaker]['total_words'] += len(statement.content.split())
-    
-    return summary
+    return {
+        speaker: {
+            'statement_count': len(statements),
+            'total_words': sum(len(s.content.split()) for s in statements),
+            'topics_discussed': []
+        }
+        for speaker, statements in transcript.statements_by_speaker.items()
+    }
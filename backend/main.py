@@ -3,22 +3,44 @@ VeriWork - FastAPI Backend
 Evidence-Backed Claim Verification Engine
 """
 
+import functools
+import hashlib
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Optional
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import Response
 
+from api.middleware import ContentSizeLimitMiddleware
 from api.routes import router as api_router
+from analysis.claim_verifier import get_verification_engine
+from analysis.gemini_client import close_gemini_client, is_gemini_configured
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifecycle: warm the verification engine, close pooled Gemini connections on shutdown"""
+    app.state.engine = get_verification_engine()
+    yield
+    await close_gemini_client()
+
 
 app = FastAPI(
     title="VeriWork",
     description="Evidence-Backed Claim Verification Engine - This system doesn't measure activity. It verifies truth.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# Bound upload size before anything is spooled or parsed (added before CORS so
+# CORS stays outermost and 413 responses still carry CORS headers)
+MAX_UPLOAD_BYTES = int(os.environ.get("MAX_UPLOAD_BYTES", 50 * 1024 * 1024))
+app.add_middleware(ContentSizeLimitMiddleware, max_content_size=MAX_UPLOAD_BYTES)
+
 # CORS for API calls
 app.add_middleware(
     CORSMiddleware,
@@ -35,8 +57,6 @@ app.include_router(api_router)
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    from analysis.gemini_client import is_gemini_configured
-    
     return {
         "status": "healthy",
         "gemini_api_configured": is_gemini_configured()
@@ -44,9 +64,16 @@ async def health_check():
 
 
 # Serve frontend static files
-# Try multiple locations for frontend files
-def find_static_dir():
+# VERIWORK_STATIC_DIR pins the location; otherwise try the known deploy layouts
+@functools.cache
+def find_static_dir() -> Optional[Path]:
     """Find the frontend static files directory"""
+    configured = os.environ.get("VERIWORK_STATIC_DIR")
+    if configured:
+        if (Path(configured) / "index.html").is_file():
+            return Path(configured)
+        print(f"VERIWORK_STATIC_DIR={configured} has no index.html, searching default locations")
+    
     possible_paths = [
         Path(__file__).parent / "static",           # Docker: copied to /app/static
         Path(__file__).parent.parent / "frontend",  # Local dev: sibling directory
@@ -54,7 +81,7 @@ def find_static_dir():
     ]
     
     for path in possible_paths:
-        if path.exists() and (path / "index.html").exists():
+        if (path / "index.html").is_file():
             return path
     
     return None
@@ -69,10 +96,17 @@ if STATIC_DIR:
     if (STATIC_DIR / "js").exists():
         app.mount("/js", StaticFiles(directory=str(STATIC_DIR / "js")), name="js")
     
+    # index.html is small: read it once instead of on every request
+    INDEX_BYTES = (STATIC_DIR / "index.html").read_bytes()
+    INDEX_ETAG = f'"{hashlib.md5(INDEX_BYTES).hexdigest()}"'
+    INDEX_HEADERS = {"ETag": INDEX_ETAG, "Cache-Control": "public, max-age=60"}
+    
     @app.get("/")
-    async def serve_frontend():
+    async def serve_frontend(request: Request):
         """Serve the frontend index.html"""
-        return FileResponse(str(STATIC_DIR / "index.html"))
+        if request.headers.get("if-none-match") == INDEX_ETAG:
+            return Response(status_code=304, headers=INDEX_HEADERS)
+        return Response(INDEX_BYTES, media_type="text/html", headers=INDEX_HEADERS)
 else:
     @app.get("/")
     async def root():
@@ -85,3 +119,19 @@ else:
             "docs": "/docs",
             "health": "/health"
         }
+
+
+if __name__ == "__main__":
+    import uvicorn
+    
+    # uvloop event loop + httptools C HTTP parser (both ship with uvicorn[standard]).
+    # Evidence lives in process memory, so extra workers (WEB_CONCURRENCY) would
+    # each see different uploads; keep one unless that state is moved out.
+    uvicorn.run(
+        "main:app",
+        host=os.environ.get("HOST", "0.0.0.0"),
+        port=int(os.environ.get("PORT", 8000)),
+        workers=int(os.environ.get("WEB_CONCURRENCY", 1)),
+        loop="uvloop",
+        http="httptools",
+    )
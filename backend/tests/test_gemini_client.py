@@ -0,0 +1,293 @@
+"""
+Tests for Gemini Client
+Contribution Truth
+"""
+
+import json
+import time
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+import sys
+sys.path.insert(0, '..')
+
+from api.models import DisprovalAnalysis, VerdictType
+from analysis.gemini_client import (
+    GEMINI_API_BASE, CacheMiss, GeminiClient, RateLimited, _TokenBucket, _to_gemini_schema
+)
+
+
+class _StubGeminiAPI:
+    """Stands in for the streamGenerateContent REST endpoint, counting API calls"""
+    
+    def __init__(self, text: str = ""):
+        self.calls = 0
+        self.text = text
+        self.last_request = None
+    
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        self.last_request = request
+        body = json.loads(request.content)
+        prompt = body["contents"][0]["parts"][0]["text"]
+        text = self.text or f"response to {prompt}"
+        # Server-sent events, split in two chunks like a streamed response
+        half = len(text) // 2
+        events = "".join(
+            f"data: {json.dumps({'candidates': [{'content': {'parts': [{'text': part}]}}]})}\r\n\r\n"
+            for part in (text[:half], text[half:])
+        )
+        return httpx.Response(200, text=events, headers={"Content-Type": "text/event-stream"})
+
+
+def _make_client(monkeypatch, policy: str = "enabled", text: str = "") -> GeminiClient:
+    monkeypatch.setenv("CACHE_POLICY", policy)
+    client = GeminiClient(api_key="test-key")
+    client.api = _StubGeminiAPI(text)
+    client._http = httpx.AsyncClient(
+        base_url=GEMINI_API_BASE, transport=httpx.MockTransport(client.api)
+    )
+    return client
+
+
+class TestResponseCache:
+    """Test the prompt-keyed response cache"""
+    
+    @pytest.mark.asyncio
+    async def test_repeat_prompt_served_from_cache(self, monkeypatch):
+        """Test that identical prompts only hit the API once"""
+        client = _make_client(monkeypatch)
+        
+        first = await client.analyze("Is this claim true?")
+        second = await client.analyze("Is this claim true?")
+        
+        assert first == second
+        assert client.api.calls == 1
+    
+    @pytest.mark.asyncio
+    async def test_different_prompts_not_shared(self, monkeypatch):
+        """Test that distinct prompts get distinct cache entries"""
+        client = _make_client(monkeypatch)
+        
+        await client.analyze("prompt one")
+        await client.analyze("prompt two")
+        
+        assert client.api.calls == 2
+    
+    @pytest.mark.asyncio
+    async def test_disabled_policy_always_calls_api(self, monkeypatch):
+        """Test that CACHE_POLICY=disabled bypasses the cache"""
+        client = _make_client(monkeypatch, "disabled")
+        
+        await client.analyze("same prompt")
+        await client.analyze("same prompt")
+        
+        assert client.api.calls == 2
+    
+    @pytest.mark.asyncio
+    async def test_replay_policy_raises_on_miss(self, monkeypatch):
+        """Test that CACHE_POLICY=replay never calls the API"""
+        client = _make_client(monkeypatch, "replay")
+        
+        with pytest.raises(CacheMiss):
+            await client.analyze("unseen prompt")
+        assert client.api.calls == 0
+    
+    @pytest.mark.asyncio
+    async def test_write_only_policy_refreshes_cache(self, monkeypatch):
+        """Test that CACHE_POLICY=write_only skips lookups but still stores"""
+        client = _make_client(monkeypatch, "write_only")
+        
+        await client.analyze("same prompt")
+        await client.analyze("same prompt")
+        
+        assert client.api.calls == 2
+        assert len(client._cache) == 1
+    
+    @pytest.mark.asyncio
+    async def test_disk_cache_survives_restart(self, monkeypatch, tmp_path):
+        """Test that GEMINI_CACHE_DIR persists responses across clients"""
+        monkeypatch.setenv("GEMINI_CACHE_DIR", str(tmp_path))
+        first = _make_client(monkeypatch)
+        await first.analyze("Is this claim true?")
+        await first.aclose()
+        
+        second = _make_client(monkeypatch, "replay")
+        
+        assert await second.analyze("Is this claim true?") == "response to Is this claim true?"
+        assert second.api.calls == 0
+        await second.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_warm_fills_cache(self, monkeypatch):
+        """Test that warm() caches every prompt for later replay"""
+        client = _make_client(monkeypatch)
+        
+        await client.warm(["prompt one", "prompt two"])
+        client.cache_policy = "replay"
+        
+        assert await client.analyze("prompt two") == "response to prompt two"
+        assert client.api.calls == 2
+    
+    def test_unknown_policy_rejected(self, monkeypatch):
+        """Test that an invalid CACHE_POLICY fails fast"""
+        monkeypatch.setenv("CACHE_POLICY", "sometimes")
+        
+        with pytest.raises(ValueError):
+            GeminiClient(api_key="test-key")
+
+
+class TestStreaming:
+    """Test streamed responses"""
+    
+    @pytest.mark.asyncio
+    async def test_chunks_yielded_as_they_arrive(self, monkeypatch):
+        """Test that analyze_stream yields each streamed chunk"""
+        client = _make_client(monkeypatch, text="VERIFIED because commits match")
+        
+        chunks = [chunk async for chunk in client.analyze_stream("Verify this")]
+        
+        assert len(chunks) == 2
+        assert "".join(chunks) == "VERIFIED because commits match"
+        assert client.api.last_request.url.params["alt"] == "sse"
+    
+    @pytest.mark.asyncio
+    async def test_streamed_response_cached_whole(self, monkeypatch):
+        """Test that a completed stream is replayed from the cache in one chunk"""
+        client = _make_client(monkeypatch, text="VERIFIED because commits match")
+        
+        [chunk async for chunk in client.analyze_stream("Verify this")]
+        replayed = [chunk async for chunk in client.analyze_stream("Verify this")]
+        
+        assert replayed == ["VERIFIED because commits match"]
+        assert client.api.calls == 1
+
+
+class TestStructuredJson:
+    """Test schema-constrained JSON responses"""
+    
+    @pytest.mark.asyncio
+    async def test_response_parsed_into_schema(self, monkeypatch):
+        """Test that the JSON response is validated against the schema"""
+        client = _make_client(monkeypatch, text="""{
+            "expected_evidence": [], "supporting_evidence": [], "counter_evidence": [],
+            "missing_evidence": ["No commits"], "verdict": "disputed",
+            "confidence": 0.7, "explanation": "Nothing found."
+        }""")
+        
+        result = await client.structured_json("Verify this", DisprovalAnalysis)
+        
+        assert result.verdict == VerdictType.DISPUTED
+        assert result.missing_evidence == ["No commits"]
+        config = json.loads(client.api.last_request.content)["generationConfig"]
+        assert config["responseMimeType"] == "application/json"
+        assert config["responseSchema"]["properties"]["verdict"]["type"] == "STRING"
+    
+    @pytest.mark.asyncio
+    async def test_structured_call_gets_larger_output_cap(self, monkeypatch):
+        """Test that only structured calls lift the short text-response token cap"""
+        client = _make_client(monkeypatch, text='{"expected_evidence": [], "supporting_evidence": [], '
+            '"counter_evidence": [], "missing_evidence": [], "verdict": "verified", '
+            '"confidence": 0.9, "explanation": "Ok."}')
+        
+        await client.analyze("List evidence")
+        text_config = json.loads(client.api.last_request.content)["generationConfig"]
+        await client.structured_json("Verify this", DisprovalAnalysis)
+        json_config = json.loads(client.api.last_request.content)["generationConfig"]
+        
+        assert text_config["maxOutputTokens"] == 2048
+        assert json_config["maxOutputTokens"] == client.structured_max_output_tokens > 2048
+    
+    @pytest.mark.asyncio
+    async def test_invalid_response_not_cached(self, monkeypatch):
+        """Test that a response failing validation is evicted so a retry calls Gemini"""
+        client = _make_client(monkeypatch, text='{"expected_evidence": ["Commits touching')
+        
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                await client.structured_json("Verify this", DisprovalAnalysis)
+        
+        assert client.api.calls == 2
+    
+    def test_schema_refs_are_inlined(self):
+        """Test that nested models and enums are inlined for Gemini"""
+        schema = _to_gemini_schema(DisprovalAnalysis.model_json_schema())
+        
+        item = schema["properties"]["supporting_evidence"]["items"]
+        assert item["type"] == "OBJECT"
+        assert item["properties"]["strength"]["enum"] == ["strong", "moderate", "weak"]
+        assert "$ref" not in json.dumps(schema)
+
+
+class TestConnectionReuse:
+    """Test the pooled HTTP client"""
+    
+    @pytest.mark.asyncio
+    async def test_http_client_shared_across_calls(self, monkeypatch):
+        """Test that every request goes through one pooled client"""
+        monkeypatch.setenv("CACHE_POLICY", "disabled")
+        client = GeminiClient(api_key="test-key")
+        
+        pool = client._http_client()
+        assert client._http_client() is pool
+        assert pool.headers["x-goog-api-key"] == "test-key"
+        
+        await client.aclose()
+        assert client._http is None
+
+
+class TestErrorResponses:
+    """Test how HTTP errors from the API are raised"""
+    
+    @pytest.mark.asyncio
+    async def test_429_raises_rate_limited(self, monkeypatch):
+        """Test that a 429 raises RateLimited and other errors do not"""
+        client = _make_client(monkeypatch, "disabled")
+        for status, error in ((429, RateLimited), (403, httpx.HTTPStatusError), (500, httpx.HTTPStatusError)):
+            client._http = httpx.AsyncClient(
+                base_url=GEMINI_API_BASE, transport=httpx.MockTransport(lambda request: httpx.Response(status))
+            )
+            with pytest.raises(error) as raised:
+                await client.analyze("hello")
+            assert status == 429 or not isinstance(raised.value, RateLimited)
+
+
+class TestTokenBucket:
+    """Test the proactive rate limiter"""
+    
+    @pytest.mark.asyncio
+    async def test_burst_within_quota_does_not_wait(self):
+        """Test that requests under the quota go straight through"""
+        bucket = _TokenBucket(rpm=20, tpm=1_000)
+        
+        start = time.monotonic()
+        for _ in range(20):
+            await bucket.acquire(estimated_tokens=10)
+        
+        assert time.monotonic() - start < 0.05
+    
+    @pytest.mark.asyncio
+    async def test_exhausted_bucket_waits_for_refill(self):
+        """Test that an empty bucket delays instead of failing"""
+        bucket = _TokenBucket(rpm=600, tpm=1_000_000)
+        bucket.request_tokens = 0
+        
+        start = time.monotonic()
+        await bucket.acquire()
+        
+        # 600 rpm refills one request every 0.1s
+        assert time.monotonic() - start >= 0.09
+    
+    @pytest.mark.asyncio
+    async def test_token_quota_is_enforced(self):
+        """Test that large prompts wait on the tokens-per-minute budget"""
+        bucket = _TokenBucket(rpm=1_000, tpm=6_000)
+        bucket.token_tokens = 0
+        
+        start = time.monotonic()
+        await bucket.acquire(estimated_tokens=10)
+        
+        # 6000 tpm refills 10 tokens every 0.1s
+        assert time.monotonic() - start >= 0.09
@@ -3,14 +3,25 @@ Tests for Git Log Parser
 Contribution Truth
 """
 
+import asyncio
 import pytest
+import io
+import json
 from datetime import datetime
 
 # Add parent to path for imports
 import sys
 sys.path.insert(0, '..')
 
-from ingestion.git_parser import parse_git_log, parse_git_log_json, parse_git_log_text
+from ingestion.git_parser import (
+    parse_git_log,
+    parse_git_log_json,
+    parse_git_log_json_stream,
+    parse_git_log_text,
+    parse_git_logs_parallel,
+    _iter_json_objects,
+)
+from api.routes import _parse_request_stream
 
 
 class TestGitLogParserJSON:
@@ -74,6 +85,114 @@ class TestGitLogParserJSON:
         result = parse_git_log_json(content)
         # Should not crash, returns empty
         assert len(result.commits) == 0
+    
+    def test_duplicate_hashes_kept_once(self):
+        """Test that concatenated logs don't double-count commits"""
+        entry = '{"hash": "abc", "author": "Alice", "date": "2024-01-15", "message": "A"}'
+        content = f'[{entry}, {{"hash": "def", "author": "Bob", "message": "B"}}, {entry}]'
+        
+        result = parse_git_log_json(content)
+        
+        assert [c.hash for c in result.commits] == ["abc", "def"]
+    
+    def test_parse_alternate_keys_and_iso_dates(self):
+        """Test key aliases from other exporters and ISO 8601 timestamps"""
+        content = """[{"sha": "abc", "author_name": "Alice", "subject": "Fix login",
+                       "authored_date": "2024-01-15T10:30:00+02:00", "files": [{"path": "auth.py"}]}]"""
+        result = parse_git_log_json(content)
+        
+        commit = result.commits[0]
+        assert (commit.hash, commit.author_name, commit.message) == ("abc", "Alice", "Fix login")
+        assert commit.timestamp.isoformat() == "2024-01-15T10:30:00+02:00"
+        assert commit.files_changed[0].filename == "auth.py"
+    
+    def test_iso_dates_after_git_default_dates(self):
+        """Test that ISO timestamps still parse once another format has been seen"""
+        content = """[{"hash": "a", "author": "Alice", "date": "Mon Jan 15 10:30:00 2024 +0000", "message": "A"},
+                     {"hash": "b", "author": "Bob", "date": "2024-01-16T09:00:00Z", "message": "B"}]"""
+        
+        result = parse_git_log_json(content)
+        
+        assert result.commits[0].timestamp.isoformat() == "2024-01-15T10:30:00+00:00"
+        assert result.commits[1].timestamp.isoformat() == "2024-01-16T09:00:00+00:00"
+
+
+class _StreamedBody:
+    """Stands in for a request whose raw body arrives in fixed-size chunks"""
+    
+    def __init__(self, body: bytes, chunk_size: int):
+        self.body = body
+        self.chunk_size = chunk_size
+    
+    async def stream(self):
+        for i in range(0, len(self.body), self.chunk_size):
+            yield self.body[i:i + self.chunk_size]
+
+
+class TestGitLogParserJSONStream:
+    """Test incremental JSON parsing"""
+    
+    CONTENT = (
+        '[{"hash": "abc", "author": "José", "date": "2024-01-15", "message": "Add {braces}, [brackets]"},\n'
+        ' {"hash": "def", "author": "Bob", "date": "2024-01-16", "message": "B", "files": ["a.py"]},\n'
+        ' {"hash": "abc", "author": "José", "date": "2024-01-15", "message": "duplicate"}]\n'
+    )
+    
+    def test_matches_whole_document_parse(self):
+        """Test that streaming gives the same commits as parsing the whole string"""
+        assert parse_git_log_json_stream(self.CONTENT).commits == parse_git_log_json(self.CONTENT).commits
+    
+    def test_small_binary_chunks(self):
+        """Test objects and UTF-8 sequences split across read() calls"""
+        result = parse_git_log_json_stream(io.BytesIO(self.CONTENT.encode()), chunk_size=3)
+        
+        assert [c.author_name for c in result.commits] == ["José", "Bob"]
+        assert result.commits[0].message == "Add {braces}, [brackets]"
+        assert result.commits[1].files_changed[0].filename == "a.py"
+    
+    def test_malformed_lines_skipped(self):
+        """Test that undecodable lines are dropped and the rest still parse"""
+        lines = ['{"hash": "abc", "author": "Alice", "message": "A"},\n', 'oops\n', '{"hash": "def", "author": "Bob", "message": "B"}\n']
+        
+        result = parse_git_log_json_stream(iter(lines))
+        
+        assert [c.hash for c in result.commits] == ["abc", "def"]
+    
+    def test_malformed_line_does_not_buffer_rest(self):
+        """Test that a bad first line is skipped without buffering everything after it"""
+        lines = ['{"hash": "bad", "message": "say "hi""}\n'] + [
+            f'{{"hash": "c{i}", "author": "Alice", "date": "2024-01-15", "message": "Commit {i}"}}\n'
+            for i in range(20000)
+        ]
+        chunks = iter(lines)
+        
+        items = _iter_json_objects(chunks)
+        
+        assert next(items)["hash"] == "c0"
+        assert len(list(chunks)) > 19990
+        assert len(parse_git_log_json_stream(iter(lines)).commits) == 20000
+    
+    def test_malformed_line_in_streamed_request_body(self):
+        """Test that a bad line arriving through a PUT body stream is skipped like a file's"""
+        body = "\n".join(['{"hash": "bad", "message": "say "hi""}'] + [
+            f'{{"hash": "c{i}", "author": "Alice", "date": "2024-01-15", "message": "Commit {i}"}}'
+            for i in range(200)
+        ]).encode()
+        
+        _, result = asyncio.run(_parse_request_stream(_StreamedBody(body, 64), "git", parse_git_log))
+        
+        assert [c.hash for c in result.commits] == [f"c{i}" for i in range(200)]
+    
+    def test_pretty_printed_objects_across_chunks(self):
+        """Test that objects spanning lines and chunks are not mistaken for malformed"""
+        content = json.dumps([
+            {"hash": f"c{i}", "author": "Alice", "date": "2024-01-15", "message": f"Commit {i}"}
+            for i in range(3)
+        ], indent=2)
+        
+        result = parse_git_log_json_stream(io.StringIO(content), chunk_size=5)
+        
+        assert [c.hash for c in result.commits] == ["c0", "c1", "c2"]
 
 
 class TestGitLogParserText:
@@ -107,6 +226,26 @@ Date:   Mon Jan 15 10:30:00 2024
         assert len(result.commits) == 1
         assert result.commits[0].author_name == "Alice Chen"
         assert "Add new feature" in result.commits[0].message
+    
+    def test_parse_git_default_dates(self):
+        """Test that git's default date format parses for every commit"""
+        content = """commit abc123
+Author: Alice Chen <alice@example.com>
+Date:   Mon Jan 15 10:30:00 2024 +0100
+    
+    First
+
+commit def456
+Author: Bob Martinez <bob@example.com>
+Date:   Tue Jan 16 09:00:00 2024 +0100
+    
+    Second"""
+        
+        result = parse_git_log_text(content)
+        
+        assert [c.timestamp.isoformat() for c in result.commits] == [
+            "2024-01-15T10:30:00+01:00", "2024-01-16T09:00:00+01:00"
+        ]
 
 
 class TestGitLogAutoDetect:
@@ -123,6 +262,44 @@ class TestGitLogAutoDetect:
         content = "abc1234 Alice - Test commit message"
         result = parse_git_log(content)
         assert len(result.commits) == 1
+    
+    def test_autodetect_line_iterable(self):
+        """Test that file-like line iterables are detected and parsed"""
+        json_lines = ['\n', '{"hash": "abc", "author": "Alice", "date": "2024-01-15", "message": "A"},\n',
+                      '{"hash": "def", "author": "Bob", "date": "2024-01-16", "message": "B"}\n']
+        text_lines = ["\n", "abc1234 Alice - First\n", "def5678 Bob - Second\n"]
+        
+        assert [c.hash for c in parse_git_log(iter(json_lines)).commits] == ["abc", "def"]
+        assert [c.author_name for c in parse_git_log(iter(text_lines)).commits] == ["Alice", "Bob"]
+    
+    def test_autodetect_bytes(self):
+        """Test that raw UTF-8 bytes parse like the decoded string"""
+        json_log = '{"hash": "abc", "author": "José", "message": "Ünïcode"},\n'
+        text_log = "abc1234 José - Fix login"
+        
+        assert parse_git_log(json_log.encode()).commits[0].message == "Ünïcode"
+        assert parse_git_log(text_log.encode()).commits[0].author_name == "José"
+
+
+class TestParallelParsing:
+    """Test parsing several git logs in worker processes"""
+    
+    def test_results_match_serial_parse_in_order(self):
+        """Test that each log parses as it would on its own, in input order"""
+        contents = [
+            '[{"hash": "abc", "author": "Alice", "date": "2024-01-15", "message": "A"}]',
+            "def5678 Bob - Fix login",
+            b'{"hash": "ghi", "author": "Carol", "date": "2024-01-16", "message": "C"}',
+        ]
+        
+        results = parse_git_logs_parallel(contents, max_workers=2)
+        
+        assert [log.contributors for log in results] == [["Alice"], ["Bob"], ["Carol"]]
+        assert results[0].commits == parse_git_log(contents[0]).commits
+    
+    def test_empty_input(self):
+        """Test that no logs give no results without starting workers"""
+        assert parse_git_logs_parallel([]) == []
 
 
 class TestGitLogContributors:
@@ -141,3 +318,17 @@ class TestGitLogContributors:
         assert len(result.contributors) == 2
         assert "Alice" in result.contributors
         assert "Bob" in result.contributors
+        assert result.commits[0].author_name is result.commits[1].author_name
+    
+    def test_contributors_in_first_appearance_order(self):
+        """Test that contributor order is deterministic"""
+        content = '''[
+            {"hash": "a", "author": "Carol", "date": "2024-01-01", "message": "m1"},
+            {"hash": "b", "author": "Alice", "date": "2024-01-02", "message": "m2"},
+            {"hash": "c", "author": "Carol", "date": "2024-01-03", "message": "m3"},
+            {"hash": "d", "author": "Bob", "date": "2024-01-04", "message": "m4"}
+        ]'''
+        
+        result = parse_git_log_json(content)
+        
+        assert result.contributors == ["Carol", "Alice", "Bob"]
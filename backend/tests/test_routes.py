@@ -0,0 +1,280 @@
+"""
+Tests for API Routes
+Contribution Truth
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import sys
+sys.path.insert(0, '..')
+
+import main
+from main import app
+from api import routes
+from api.middleware import ContentSizeLimitMiddleware
+from analysis.claim_verifier import get_verification_engine
+
+
+GIT_LOG = """commit abc1234
+Author: Bob Martinez <bob@example.com>
+Date: 2024-01-15
+    
+    Implement authentication system
+"""
+
+TRANSCRIPT = """Date: 2024-01-16
+Bob Martinez: I finished the auth module.
+Alice Chen: Great, I'll review it.
+"""
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
+        client.delete("/api/evidence/clear")
+
+
+class TestEvidenceUpload:
+    """Test evidence upload and status endpoints"""
+    
+    def test_engine_bound_at_startup(self, client):
+        """Test that the verification engine is created before the first request"""
+        assert client.app.state.engine is get_verification_engine()
+    
+    def test_upload_git_log_and_transcript(self, client):
+        """Test that uploads are parsed line by line into evidence"""
+        response = client.post("/api/evidence/upload", files={
+            "git_log": ("git.log", GIT_LOG.encode(), "text/plain"),
+            "transcript": ("sprint.txt", TRANSCRIPT.encode(), "text/plain"),
+        })
+        
+        assert response.status_code == 200
+        body = response.json()
+        assert body["git_commits_parsed"] == 1
+        assert body["transcript_statements_parsed"] == 2
+        assert body["contributors_found"] == ["Alice Chen", "Bob Martinez"]
+    
+    def test_upload_requires_a_file(self, client):
+        """Test that an empty upload is rejected"""
+        response = client.post("/api/evidence/upload")
+        
+        assert response.status_code == 400
+    
+    def test_invalid_utf8_rejected(self, client):
+        """Test that undecodable uploads fail with a 400"""
+        response = client.post("/api/evidence/upload", files={
+            "transcript": ("bad.txt", b"\xff\xfe Bob: hi", "text/plain"),
+        })
+        
+        assert response.status_code == 400
+    
+    def test_status_reflects_upload(self, client):
+        """Test that evidence status reports the uploaded evidence"""
+        client.post("/api/evidence/upload", files={
+            "git_log": ("git.log", GIT_LOG.encode(), "text/plain"),
+        })
+        
+        status = client.get("/api/evidence/status").json()
+        
+        assert status["has_evidence"] is True
+        assert status["git_commits"] == 1
+    
+    def test_status_without_evidence(self, client):
+        """Test that the empty status omits the Gemini flag"""
+        status = client.get("/api/evidence/status").json()
+        
+        assert status == {"has_evidence": False, "git_commits": 0, "transcript_statements": 0, "contributors": []}
+    
+    def test_reupload_reuses_parsed_evidence(self, client):
+        """Test that identical uploads are parsed once and share a signature"""
+        files = {"git_log": ("git.log", GIT_LOG.encode(), "text/plain")}
+        
+        client.post("/api/evidence/upload", files=files)
+        first = routes._current_evidence
+        client.post("/api/evidence/upload", files=files)
+        
+        assert routes._current_evidence.git_log is first.git_log
+        assert client.app.state.engine.evidence_signature is not None
+
+
+class TestVerdictCache:
+    """Test that repeated claims are answered from the verdict cache"""
+    
+    def test_repeat_claim_served_from_cache(self, client, monkeypatch):
+        """Test that the engine runs once per (evidence, claimant, claim)"""
+        client.post("/api/evidence/upload", files={
+            "git_log": ("git.log", GIT_LOG.encode(), "text/plain"),
+        })
+        engine = client.app.state.engine
+        calls = []
+        verify = engine.verify_claim
+        
+        async def counting_verify(**kwargs):
+            calls.append(kwargs)
+            return await verify(**kwargs)
+        
+        monkeypatch.setattr(engine, "verify_claim", counting_verify)
+        
+        first = client.post("/api/verify", json={"claimant": "Bob Martinez", "claim": "I built auth"})
+        second = client.post("/api/verify", json={"claimant": "bob martinez", "claim": "I  built AUTH"})
+        
+        assert first.json() == second.json()
+        assert len(calls) == 1
+    
+    def test_fallback_verdicts_not_cached(self, client, monkeypatch):
+        """Test that a heuristic fallback after a Gemini failure is recomputed on retry"""
+        client.post("/api/evidence/upload", files={
+            "git_log": ("git.log", GIT_LOG.encode(), "text/plain"),
+        })
+        engine = client.app.state.engine
+        calls = []
+        verify = engine.verify_claim
+        
+        async def failing_verify(**kwargs):
+            calls.append(kwargs)
+            verdict = await verify(**kwargs)
+            verdict.cacheable = False
+            return verdict
+        
+        monkeypatch.setattr(engine, "verify_claim", failing_verify)
+        
+        first = client.post("/api/verify", json={"claimant": "Bob Martinez", "claim": "I built auth"})
+        client.post("/api/verify", json={"claimant": "Bob Martinez", "claim": "I built auth"})
+        
+        assert len(calls) == 2
+        assert len(routes._verdict_cache) == 0
+        assert "cacheable" not in first.json()
+    
+    def test_verdict_serialized_by_response_model(self, client):
+        """Test that the verdict response matches the model's JSON dump"""
+        client.post("/api/evidence/upload", files={
+            "git_log": ("git.log", GIT_LOG.encode(), "text/plain"),
+        })
+        
+        body = client.post("/api/verify", json={"claimant": "Bob Martinez", "claim": "I built auth"}).json()
+        cached = next(iter(routes._verdict_cache.values()))
+        
+        assert body == cached.to_dict()
+        assert body["verdict"].isupper()
+    
+    def test_clear_invalidates_cache(self, client):
+        """Test that clearing evidence empties the verdict cache"""
+        client.post("/api/evidence/upload", files={
+            "git_log": ("git.log", GIT_LOG.encode(), "text/plain"),
+        })
+        client.post("/api/verify", json={"claimant": "Bob Martinez", "claim": "I built auth"})
+        
+        client.delete("/api/evidence/clear")
+        
+        assert len(routes._verdict_cache) == 0
+
+
+class TestStreamingUpload:
+    """Test raw-body evidence uploads"""
+    
+    def test_put_git_log_and_transcript(self, client):
+        """Test that streamed uploads build up the evidence together"""
+        chunks = (GIT_LOG[i:i + 16].encode() for i in range(0, len(GIT_LOG), 16))
+        git = client.put("/api/evidence/git", content=chunks)
+        transcript = client.put(
+            "/api/evidence/transcript", params={"title": "Sprint"}, content=TRANSCRIPT.encode()
+        )
+        
+        assert git.status_code == 200
+        assert git.json()["git_commits_parsed"] == 1
+        assert transcript.json()["transcript_statements_parsed"] == 2
+        status = client.get("/api/evidence/status").json()
+        assert status["git_commits"] == 1
+        assert status["transcript_statements"] == 2
+    
+    def test_put_git_log_skips_malformed_json_lines(self, client):
+        """Test that a bad JSON line costs only that line, as with a file upload"""
+        commits = [
+            f'{{"hash": "c{i}", "author": "Alice", "date": "2024-01-15", "message": "Commit {i}"}}'
+            for i in range(200)
+        ]
+        body = "\n".join(['{"hash": "bad", "message": "say "hi""}'] + commits).encode()
+        chunks = (body[i:i + 64] for i in range(0, len(body), 64))
+        
+        streamed = client.put("/api/evidence/git", content=chunks)
+        uploaded = client.post("/api/evidence/upload", files={
+            "git_log": ("git.json", body, "application/json"),
+        })
+        
+        assert streamed.json()["git_commits_parsed"] == 200
+        assert uploaded.json()["git_commits_parsed"] == 200
+    
+    def test_multibyte_characters_split_across_chunks(self, client):
+        """Test that UTF-8 sequences split between chunks decode correctly"""
+        body = "José Núñez: Ready to ship\n".encode()
+        chunks = (body[i:i + 3] for i in range(0, len(body), 3))
+        
+        client.put("/api/evidence/transcript", content=chunks)
+        
+        assert routes._current_evidence.transcripts[0].participants == ["José Núñez"]
+    
+    def test_put_invalid_utf8_rejected(self, client):
+        """Test that undecodable streamed bodies fail with a 400"""
+        response = client.put("/api/evidence/transcript", content=b"\xff\xfe Bob: hi")
+        
+        assert response.status_code == 400
+
+
+class TestContentSizeLimit:
+    """Test that oversized request bodies are rejected"""
+    
+    @pytest.fixture
+    def small_client(self):
+        small_app = FastAPI(lifespan=main.lifespan)
+        small_app.add_middleware(ContentSizeLimitMiddleware, max_content_size=64)
+        small_app.include_router(routes.router)
+        with TestClient(small_app) as client:
+            yield client
+            client.delete("/api/evidence/clear")
+    
+    def test_declared_length_over_limit(self, small_client):
+        """Test that a Content-Length over the limit is rejected up front"""
+        response = small_client.put("/api/evidence/git", content=b"x" * 100)
+        
+        assert response.status_code == 413
+    
+    def test_streamed_body_over_limit(self, small_client):
+        """Test that a chunked body is cut off once it crosses the limit"""
+        chunks = (b"abc1234 Alice - Commit\n" for _ in range(10))
+        
+        response = small_client.put("/api/evidence/git", content=chunks)
+        
+        assert response.status_code == 413
+        assert routes._current_evidence is None
+    
+    def test_multipart_over_limit(self, small_client):
+        """Test that the multipart upload endpoint is bounded too"""
+        response = small_client.post("/api/evidence/upload", files={
+            "git_log": ("git.log", GIT_LOG.encode() * 10, "text/plain"),
+        })
+        
+        assert response.status_code == 413
+    
+    def test_body_within_limit_accepted(self, small_client):
+        """Test that small bodies pass through"""
+        response = small_client.put("/api/evidence/git", content=b"abc1234 Alice - Commit\n")
+        
+        assert response.status_code == 200
+
+
+@pytest.mark.skipif(main.STATIC_DIR is None, reason="frontend files not found")
+class TestFrontend:
+    """Test serving the frontend index page"""
+    
+    def test_index_revalidated_with_etag(self, client):
+        """Test that a matching If-None-Match gets a 304 without the body"""
+        first = client.get("/")
+        second = client.get("/", headers={"If-None-Match": first.headers["etag"]})
+        
+        assert first.status_code == 200
+        assert first.headers["content-type"].startswith("text/html")
+        assert second.status_code == 304
+        assert second.content == b""
@@ -4,6 +4,7 @@ Contribution Truth
 """
 
 import pytest
+from datetime import datetime
 
 import sys
 sys.path.insert(0, '..')
@@ -67,6 +68,7 @@ Carol: Fourth point."""
         assert "Alice" in result.participants
         assert "Bob" in result.participants
         assert "Carol" in result.participants
+        assert result.statements[0].speaker is result.statements[2].speaker
     
     def test_multiline_statement(self):
         """Test handling multi-line statements"""
@@ -94,11 +96,82 @@ Bob: Agreed."""
         # Should only have the actual statements
         assert len(result.statements) == 2
     
+    def test_headers_skipped_in_any_case(self):
+        """Test that header keywords and prefixes are matched case-insensitively"""
+        content = """SPRINT MEETING NOTES
+DATE: 2024-01-15
+Attendees: Alice, Bob
+Alice: Let's start"""
+        
+        result = parse_transcript(content)
+        
+        assert [s.speaker for s in result.statements] == ["Alice"]
+    
+    def test_header_words_inside_statements_kept(self):
+        """Test that date/separator text mid-statement is not treated as a header"""
+        content = """Date: 2024-01-15
+Alice: The due date: Friday
+Bob: Agreed --- shipping then"""
+        
+        result = parse_transcript(content)
+        
+        assert [s.speaker for s in result.statements] == ["Alice", "Bob"]
+    
+    def test_detected_format_tried_first(self):
+        """Test that a dash-format transcript keeps colons inside messages"""
+        content = "\n".join(f"Alice - Update {i}" for i in range(5)) + "\nBob - Ratio is 3:1"
+        
+        result = parse_transcript(content)
+        
+        assert result.statements[-1].speaker == "Bob"
+        assert result.statements[-1].content == "Ratio is 3:1"
+    
+    def test_mixed_format_lines_after_detection(self):
+        """Test that timestamped and other-format lines survive format detection"""
+        cases = [
+            ("Alice: Update {i}", "10:30 Frank: six", ("Frank", "six", "10:30")),
+            ("[Alice] Update {i}", "[10:30] Frank: six", ("Frank", "six", "10:30")),
+            ("Alice - Update {i}", "Carol: ratio a-b", ("Carol", "ratio a-b", None)),
+            ("Alice - Update {i}", "[Carol] ratio a-b", ("Carol", "ratio a-b", None)),
+        ]
+        for template, line, expected in cases:
+            content = "\n".join(template.format(i=i) for i in range(5)) + "\n" + line
+            
+            last = parse_transcript(content).statements[-1]
+            
+            assert (last.speaker, last.content, last.timestamp) == expected
+    
+    def test_meeting_date_formats(self):
+        """Test that ISO, US slash and US dash header dates are all recognised"""
+        dates = [
+            parse_transcript(f"Date: {text}\nAlice: Hi").date
+            for text in ("2024-01-15", "01/15/2024", "01-15-2024")
+        ]
+        
+        assert dates == [datetime(2024, 1, 15)] * 3
+    
     def test_empty_transcript(self):
         """Test handling empty transcript"""
         result = parse_transcript("")
         assert len(result.statements) == 0
         assert len(result.participants) == 0
+    
+    def test_title_prefix_removed(self):
+        """Test that honorifics are stripped from speaker names"""
+        result = parse_transcript("Dr. Smith: Reviewed the design\nProf.jones - Approved it")
+        
+        assert [s.speaker for s in result.statements] == ["Smith", "Jones"]
+    
+    def test_parse_line_iterable(self):
+        """Test that an iterable of lines parses like the joined string"""
+        content = "\n\nDate: 2024-01-15\nAlice: First point\nwith more detail\nBob: Second point\n\n"
+        
+        from_string = parse_transcript(content)
+        from_lines = parse_transcript(iter(content.splitlines(keepends=True)))
+        
+        assert from_lines.statements == from_string.statements
+        assert from_lines.date == from_string.date
+        assert from_lines.statements[1].line_number == 4
 
 
 class TestSpeakerMentions:
@@ -125,6 +198,42 @@ Carol: Yes, bob's code is clean."""
         mentions = extract_speaker_mentions(transcript, "Bob")
         
         assert len(mentions) == 2
+    
+    def test_mentions_match_whole_words(self):
+        """Test that a name is not matched inside a longer word"""
+        transcript = parse_transcript("Alice: Bobby fixed it\nCarol: Thanks Bob!")
+        
+        mentions = extract_speaker_mentions(transcript, "Bob")
+        
+        assert [m.speaker for m in mentions] == ["Carol"]
+    
+    def test_names_ending_in_punctuation(self):
+        """Test that names like "Bob M." and "J.R." are still found as whole words"""
+        transcript = parse_transcript("Alice: Ask Bob M. about it\nCarol: J.R. wrote the tests\nDave: Bob Ma. said no")
+        
+        assert [m.speaker for m in extract_speaker_mentions(transcript, "Bob M.")] == ["Alice"]
+        assert [m.speaker for m in extract_speaker_mentions(transcript, "J.R.")] == ["Carol"]
+    
+    def test_multi_word_names_use_word_index(self):
+        """Test that full-name mentions need every word, adjacent, in one statement"""
+        transcript = parse_transcript(
+            "Alice: Bob Martinez merged it\n"
+            "Carol: Martinez and Bob paired\n"
+            "Dave: bob martinez again"
+        )
+        
+        mentions = extract_speaker_mentions(transcript, "Bob Martinez")
+        
+        assert [m.speaker for m in mentions] == ["Alice", "Dave"]
+        assert transcript.word_index["martinez"] == [0, 1, 2]
+    
+    def test_statements_carry_lowercased_content(self):
+        """Test that lowercased content is stored once at parse time and not serialized"""
+        transcript = parse_transcript("Alice: Bob Fixed The API")
+        stmt = transcript.statements[0]
+        
+        assert stmt.content_lower == "bob fixed the api"
+        assert "content_lower" not in transcript.model_dump()["statements"][0]
 
 
 class TestSpeakerSummary: